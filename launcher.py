@@ -1,7 +1,11 @@
 """Launcher script for School Comms Aggregator - builds to .exe for taskbar pinning."""
+import multiprocessing
 import os
 import sys
 
+# Worker processes (PDF text extraction) re-launch this executable on Windows
+multiprocessing.freeze_support()
+
 # Determine the app directory
 if getattr(sys, 'frozen', False):
     # Running as PyInstaller bundle - use fixed path to project
@@ -27,6 +31,7 @@ if app_dir not in sys.path:
 os.chdir(app_dir)
 os.environ["PYTHONPATH"] = app_dir
 
-# Launch the main app
-from src.main import main
-main()
+# Launch the main app (not in spawned worker processes, which import this module)
+if __name__ == "__main__":
+    from src.main import main
+    main()
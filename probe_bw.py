@@ -1,20 +1,10 @@
 """Probe Brightwheel API endpoints to discover the right ones."""
 
 import json
-from src.services.brightwheel_auth import BrightwheelAuth
-from src.config.settings import BW_API_BASE
 
-auth = BrightwheelAuth()
-if not auth.restore_session():
-    print("No session found - set up Brightwheel first")
-    exit(1)
+from probe_common import build_session, probe_many
 
-import requests
-session = requests.Session()
-session.cookies.update(auth.get_cookies_dict())
-session.headers.update({"Accept": "application/json"})
-if auth.csrf_token:
-    session.headers["X-CSRF-Token"] = auth.csrf_token
+session = build_session(require_login=True)
 
 # Try various base URLs and endpoints
 bases = [
@@ -39,24 +29,39 @@ endpoints = [
     "/children",
 ]
 
+SENTINEL = "/users/me"
+JSON_CONTENT_TYPE = "application/json"
+
+
+def report(url, resp):
+    if isinstance(resp, Exception):
+        print(f"[ERR] {url}: {resp}")
+        return
+    status = resp.status_code
+    if status in (200, 201):
+        is_json = resp.headers.get("content-type", "").startswith(JSON_CONTENT_TYPE)
+        data = resp.json() if is_json else resp.text[:200]
+        preview = json.dumps(data, indent=2, default=str)[:500]
+        print(f"[{status}] {url}")
+        print(f"  {preview}\n")
+    elif status in (301, 302):
+        print(f"[{status}] {url} -> {resp.headers.get('Location', '?')}")
+    elif status != 404:
+        print(f"[{status}] {url}")
+
+
 print("=== Probing Brightwheel API ===\n")
 
-for base in bases:
-    for ep in endpoints:
-        url = f"{base}{ep}"
-        try:
-            resp = session.get(url, timeout=10, allow_redirects=False)
-            status = resp.status_code
-            if status in (200, 201):
-                data = resp.json() if resp.headers.get("content-type", "").startswith("application/json") else resp.text[:200]
-                preview = json.dumps(data, indent=2, default=str)[:500]
-                print(f"[{status}] {url}")
-                print(f"  {preview}\n")
-            elif status in (301, 302):
-                print(f"[{status}] {url} -> {resp.headers.get('Location', '?')}")
-            elif status != 404:
-                print(f"[{status}] {url}")
-        except Exception as e:
-            print(f"[ERR] {url}: {e}")
+# Phase 1: one sentinel request per base; usually only one base is real
+live_bases = []
+for base, (url, resp) in zip(bases, probe_many(session, [f"{base}{SENTINEL}" for base in bases])):
+    report(url, resp)
+    if not isinstance(resp, Exception) and resp.status_code < 400:
+        live_bases.append(base)
+
+# Phase 2: expand the full endpoint list only for bases that answered
+urls = [f"{base}{ep}" for base in live_bases for ep in endpoints if ep != SENTINEL]
+for url, resp in probe_many(session, urls):
+    report(url, resp)
 
 print("\n=== Done ===")
@@ -1,21 +1,34 @@
 """Deeper probe using known user ID to find students, messages, activities."""
 
 import json
-from src.services.brightwheel_auth import BrightwheelAuth
 
-auth = BrightwheelAuth()
-auth.restore_session()
+from probe_common import SKIP_STATUSES, build_session, probe, probe_many
 
-import requests
-s = requests.Session()
-s.cookies.update(auth.get_cookies_dict())
-s.headers.update({"Accept": "application/json"})
-if auth.csrf_token:
-    s.headers["X-CSRF-Token"] = auth.csrf_token
+s = build_session()
 
 BASE = "https://schools.mybrightwheel.com/api/v1"
 USER_ID = "a3c3d5ed-c7f5-4d02-a8e2-2f6ec282e45d"
 
+
+def probe_all(base, eps):
+    """Probe base+ep for every endpoint concurrently and print results in order."""
+    results = probe_many(s, [f"{base}{ep}" for ep in eps])
+
+    for ep, (_, r) in zip(eps, results):
+        if isinstance(r, Exception):
+            print(f"\n[ERR] {ep}: {r}")
+        elif r.status_code == 200:
+            try:
+                data = r.json()
+                preview = json.dumps(data, indent=2, default=str)[:800]
+            except Exception:
+                preview = r.text[:300]
+            print(f"\n[200] {ep}")
+            print(f"  {preview}")
+        elif r.status_code not in SKIP_STATUSES:
+            print(f"\n[{r.status_code}] {ep}")
+
+
 # Get full user profile
 print("=== Full User Profile ===")
 r = s.get(f"{BASE}/users/{USER_ID}")
@@ -47,22 +60,7 @@ endpoints = [
     f"/users/{USER_ID}/notifications",
 ]
 
-for ep in endpoints:
-    url = f"{BASE}{ep}"
-    try:
-        r = s.get(url, timeout=10, allow_redirects=False)
-        if r.status_code == 200:
-            try:
-                data = r.json()
-                preview = json.dumps(data, indent=2, default=str)[:800]
-            except Exception:
-                preview = r.text[:300]
-            print(f"\n[200] {ep}")
-            print(f"  {preview}")
-        elif r.status_code not in (404, 301, 302):
-            print(f"\n[{r.status_code}] {ep}")
-    except Exception as e:
-        print(f"\n[ERR] {ep}: {e}")
+probe_all(BASE, endpoints)
 
 # Also try v2
 print("\n\n=== V2 Endpoints ===")
@@ -76,21 +74,12 @@ v2_endpoints = [
     "/feed",
     "/students",
 ]
-for ep in v2_endpoints:
-    url = f"{BASE2}{ep}"
-    try:
-        r = s.get(url, timeout=10, allow_redirects=False)
-        if r.status_code == 200:
-            try:
-                data = r.json()
-                preview = json.dumps(data, indent=2, default=str)[:800]
-            except Exception:
-                preview = r.text[:300]
-            print(f"\n[200] {ep}")
-            print(f"  {preview}")
-        elif r.status_code not in (404, 301, 302):
-            print(f"\n[{r.status_code}] {ep}")
-    except Exception as e:
-        print(f"\n[ERR] {ep}: {e}")
+# Only expand the v2 grid if the API version exists at all for this user
+_, sentinel = probe(s, f"{BASE2}/users/{USER_ID}")
+if isinstance(sentinel, Exception) or sentinel.status_code >= 400:
+    status = sentinel if isinstance(sentinel, Exception) else sentinel.status_code
+    print(f"\n[{status}] /users/{USER_ID} - skipping v2 endpoints")
+else:
+    probe_all(BASE2, v2_endpoints)
 
 print("\n=== Done ===")
@@ -1,17 +1,10 @@
 """Probe activities and messages for known students."""
 
 import json
-from src.services.brightwheel_auth import BrightwheelAuth
 
-auth = BrightwheelAuth()
-auth.restore_session()
+from probe_common import SKIP_STATUSES, build_session, probe_many
 
-import requests
-s = requests.Session()
-s.cookies.update(auth.get_cookies_dict())
-s.headers.update({"Accept": "application/json"})
-if auth.csrf_token:
-    s.headers["X-CSRF-Token"] = auth.csrf_token
+s = build_session()
 
 BASE = "https://schools.mybrightwheel.com/api/v1"
 USER_ID = "a3c3d5ed-c7f5-4d02-a8e2-2f6ec282e45d"
@@ -47,38 +40,36 @@ msg_endpoints = [
 print("\n\n=== Message Endpoints ===")
 for school_id in school_ids:
     print(f"\n--- School: {school_id} ---")
-    for ep in msg_endpoints:
-        for url in [
-            f"{BASE}/schools/{school_id}{ep}",
-            f"{BASE}{ep}?school_id={school_id}",
-        ]:
-            try:
-                r = s.get(url, timeout=10, allow_redirects=False)
-                if r.status_code == 200:
-                    preview = json.dumps(r.json(), indent=2, default=str)[:500]
-                    print(f"\n[200] {url}")
-                    print(f"  {preview}")
-                elif r.status_code not in (404, 301, 302):
-                    print(f"[{r.status_code}] {url}")
-            except Exception as e:
-                print(f"[ERR] {url}: {e}")
+    urls = [
+        url
+        for ep in msg_endpoints
+        for url in (f"{BASE}/schools/{school_id}{ep}", f"{BASE}{ep}?school_id={school_id}")
+    ]
+    for url, r in probe_many(s, urls):
+        if isinstance(r, Exception):
+            print(f"[ERR] {url}: {r}")
+        elif r.status_code == 200:
+            preview = json.dumps(r.json(), indent=2, default=str)[:500]
+            print(f"\n[200] {url}")
+            print(f"  {preview}")
+        elif r.status_code not in SKIP_STATUSES:
+            print(f"[{r.status_code}] {url}")
 
 # Also try student-level messages
 print("\n\n=== Student Message Endpoints ===")
+student_eps = ["/messages", "/conversations", "/inbox", "/feed"]
 for entry in students_data["students"]:
     st = entry["student"]
     sid = st["object_id"]
     print(f"\n--- {st['first_name']} ({sid}) ---")
-    for ep in ["/messages", "/conversations", "/inbox", "/feed"]:
-        url = f"{BASE}/students/{sid}{ep}"
-        try:
-            r = s.get(url, timeout=10, allow_redirects=False)
-            if r.status_code == 200:
-                preview = json.dumps(r.json(), indent=2, default=str)[:500]
-                print(f"[200] {ep}: {preview}")
-            elif r.status_code not in (404, 301, 302):
-                print(f"[{r.status_code}] {ep}")
-        except Exception as e:
-            print(f"[ERR] {ep}: {e}")
+    results = probe_many(s, [f"{BASE}/students/{sid}{ep}" for ep in student_eps])
+    for ep, (_, r) in zip(student_eps, results):
+        if isinstance(r, Exception):
+            print(f"[ERR] {ep}: {r}")
+        elif r.status_code == 200:
+            preview = json.dumps(r.json(), indent=2, default=str)[:500]
+            print(f"[200] {ep}: {preview}")
+        elif r.status_code not in SKIP_STATUSES:
+            print(f"[{r.status_code}] {ep}")
 
 print("\n=== Done ===")
@@ -0,0 +1,52 @@
+"""Shared Brightwheel session setup and concurrent GET helpers for the probe_bw* scripts."""
+
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from src.services.brightwheel_auth import BrightwheelAuth
+
+CONCURRENCY = 20
+
+# Statuses the probes treat as "nothing here" and don't print
+SKIP_STATUSES = frozenset({404, 301, 302})
+
+
+def build_session(require_login: bool = False) -> requests.Session:
+    """Restore the saved Brightwheel session and return a pooled requests.Session.
+
+    Exits the script if require_login is set and no saved session exists.
+    """
+    auth = BrightwheelAuth()
+    if not auth.restore_session() and require_login:
+        print("No session found - set up Brightwheel first")
+        raise SystemExit(1)
+
+    session = requests.Session()
+    # Keep-alive pools big enough for every concurrent probe (a few hosts at most)
+    session.mount("https://", HTTPAdapter(
+        pool_connections=4,
+        pool_maxsize=50,
+        max_retries=Retry(total=2, backoff_factor=0.3, status_forcelist=(429, 502, 503, 504)),
+    ))
+    auth.apply_to_session(session)
+    session.headers.update({"Accept": "application/json"})
+    if auth.csrf_token:
+        session.headers["X-CSRF-Token"] = auth.csrf_token
+    return session
+
+
+def probe(session: requests.Session, url: str):
+    """GET a single URL, returning (url, response) or (url, exception)."""
+    try:
+        return url, session.get(url, timeout=10, allow_redirects=False)
+    except Exception as e:
+        return url, e
+
+
+def probe_many(session: requests.Session, urls: list[str]) -> list:
+    """Probe all URLs concurrently; map() keeps results in input order."""
+    with ThreadPoolExecutor(max_workers=CONCURRENCY) as pool:
+        return list(pool.map(lambda url: probe(session, url), urls))
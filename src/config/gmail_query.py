@@ -20,11 +20,19 @@ KEYWORDS = [
 ]
 
 
+def _compose_query() -> str:
+    from_clauses = " OR ".join(SENDER_DOMAINS)
+    keyword_clauses = " OR ".join(f'"{kw}"' for kw in KEYWORDS)
+    return f"from:({from_clauses}) OR ({keyword_clauses})"
+
+
+# Inputs are module constants, so build the query once at import time
+_QUERY = _compose_query()
+
+
 def build_gmail_query() -> str:
     """Build the Gmail search query string.
 
     Returns the query combining sender domain matches (OR) with keyword matches (OR).
     """
-    from_clauses = " OR ".join(SENDER_DOMAINS)
-    keyword_clauses = " OR ".join(f'"{kw}"' for kw in KEYWORDS)
-    return f"from:({from_clauses}) OR ({keyword_clauses})"
+    return _QUERY
@@ -11,6 +11,7 @@ DATA_DIR = PROJECT_ROOT / "data"
 DB_PATH = DATA_DIR / "school_comms.db"
 ATTACHMENTS_DIR = DATA_DIR / "attachments"
 BW_SESSION_PATH = DATA_DIR / "brightwheel_session.json"
+BW_PAGE_CACHE_PATH = DATA_DIR / "brightwheel_page_cache.json"
 WA_SESSION_PATH = DATA_DIR / "whatsapp_session.json"
 WA_PROFILE_DIR = DATA_DIR / "whatsapp_profile"
 
@@ -39,9 +40,19 @@ BW_API_BASE = "https://schools.mybrightwheel.com/api/v1"
 # Claude model for summaries
 CLAUDE_MODEL = "claude-haiku-4-5-20251001"
 
+_dirs_ready = False
+
+
 # Ensure runtime directories exist
 def ensure_dirs():
-    """Create data directories if they don't exist."""
+    """Create data directories if they don't exist (once per process)."""
+    global _dirs_ready
+    if _dirs_ready:
+        return
     DATA_DIR.mkdir(parents=True, exist_ok=True)
     ATTACHMENTS_DIR.mkdir(parents=True, exist_ok=True)
     CREDENTIALS_DIR.mkdir(parents=True, exist_ok=True)
+    _dirs_ready = True
+
+
+ensure_dirs()
@@ -3,13 +3,7 @@
 import logging
 import sys
 
-from PySide6.QtCore import Qt
-from PySide6.QtWidgets import QApplication
-
 from src.config.settings import ensure_dirs
-from src.models.base import init_db
-from src.ui.main_window import MainWindow
-from src.ui.theme import get_app_stylesheet
 
 
 def main():
@@ -20,6 +14,17 @@ def main():
     )
 
     ensure_dirs()
+
+    # Heavy imports (Qt, SQLAlchemy, the UI/service tree) are deferred until
+    # here so importing this module from the launcher stays cheap.
+    from PySide6.QtCore import Qt
+    from PySide6.QtWidgets import QApplication
+
+    from src.models.base import init_db
+    from src.services.brightwheel_auth import BrightwheelAuth
+    from src.ui.main_window import MainWindow
+    from src.ui.theme import get_app_stylesheet
+
     init_db()
 
     # Enable high-DPI scaling
@@ -31,6 +36,7 @@ def main():
     app.setApplicationName("School Comms Aggregator")
     app.setOrganizationName("SchoolComms")
     app.setStyleSheet(get_app_stylesheet())
+    app.aboutToQuit.connect(BrightwheelAuth.close_browser)
 
     window = MainWindow()
     window.show()
@@ -1,40 +1,78 @@
 """SQLAlchemy engine and session factory."""
 
 import logging
+from datetime import datetime
+from functools import lru_cache
 
-from sqlalchemy import create_engine, inspect, text
+import orjson
+from sqlalchemy import bindparam, case, create_engine, event, inspect, select, text, update
 from sqlalchemy.orm import DeclarativeBase, sessionmaker
 
-from src.config.settings import DB_PATH, ensure_dirs
+from src.config.settings import DB_PATH
 
 logger = logging.getLogger(__name__)
 
 
+# sync_state.source marker for the one-shot checklist event_date backfill
+_BACKFILL_FLAG = "event_backfill_v1"
+
+# Set once init_db() has created tables and run the migration chain
+_migrated = False
+
+
 class Base(DeclarativeBase):
     pass
 
 
-_engine = None
-_SessionLocal = None
+# Applied to every new SQLite connection. WAL + synchronous=NORMAL turns the
+# per-commit fsync of the default rollback journal into a cheap WAL append.
+_SQLITE_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA mmap_size=268435456",  # 256 MB
+    "PRAGMA cache_size=-65536",  # 64 MB (negative = KiB)
+    "PRAGMA temp_store=MEMORY",
+)
+
+
+def _set_sqlite_pragmas(dbapi_conn, connection_record):
+    cursor = dbapi_conn.cursor()
+    try:
+        for pragma in _SQLITE_PRAGMAS:
+            cursor.execute(pragma)
+    finally:
+        cursor.close()
+
 
+def _json_dumps(obj) -> str:
+    return orjson.dumps(obj).decode()
 
+
+@lru_cache(maxsize=1)
 def get_engine():
-    global _engine
-    if _engine is None:
-        ensure_dirs()
-        _engine = create_engine(f"sqlite:///{DB_PATH}", echo=False)
-    return _engine
+    engine = create_engine(
+        f"sqlite:///{DB_PATH}",
+        echo=False,
+        json_serializer=_json_dumps,
+        json_deserializer=orjson.loads,
+    )
+    event.listen(engine, "connect", _set_sqlite_pragmas)
+    return engine
 
 
+@lru_cache(maxsize=1)
 def get_session_factory():
-    global _SessionLocal
-    if _SessionLocal is None:
-        _SessionLocal = sessionmaker(bind=get_engine())
-    return _SessionLocal
+    # Sessions are short-lived and objects are read after commit (e.g. toggle
+    # results, rendered rows), so don't force a re-SELECT of every attribute.
+    return sessionmaker(bind=get_engine(), expire_on_commit=False)
 
 
 def init_db():
-    """Create all tables."""
+    """Create all tables and run migrations (once per process)."""
+    global _migrated
+    if _migrated:
+        return
+
     from src.models.communication import (  # noqa: F401
         Attachment,
         ChecklistItem,
@@ -43,73 +81,94 @@ def init_db():
         SyncState,
     )
 
-    Base.metadata.create_all(get_engine())
-    _migrate_attachment_extracted_text()
+    engine = get_engine()
+    Base.metadata.create_all(engine)
+
+    # One inspector pass shared by the column migrations
+    inspector = inspect(engine)
+    schema = {
+        table: {col["name"] for col in inspector.get_columns(table)}
+        for table in ("attachments", "checklist_items", "daily_summaries")
+    }
+
+    _migrate_attachment_extracted_text(schema["attachments"])
     _migrate_fix_pdf_mimetypes()
-    _migrate_checklist_event_date()
+    _migrate_checklist_event_date(schema["checklist_items"])
+    _migrate_summary_source_hash(schema["daily_summaries"])
+    _migrate_add_indexes()
     _backfill_event_dates()
+    _migrated = True
 
 
-def _migrate_attachment_extracted_text():
+def _migrate_attachment_extracted_text(columns: set[str]):
     """Add extracted_text column to attachments table if missing (safe migration)."""
     engine = get_engine()
-    inspector = inspect(engine)
-    columns = [col["name"] for col in inspector.get_columns("attachments")]
     if "extracted_text" not in columns:
         logger.info("Migrating: adding extracted_text column to attachments table")
         with engine.begin() as conn:
             conn.execute(text("ALTER TABLE attachments ADD COLUMN extracted_text TEXT"))
 
 
+_PDF_FIX_BATCH = 500
+
+
 def _migrate_fix_pdf_mimetypes():
     """Fix attachments that have PDF URLs but wrong mime_type (one-time fixup)."""
-    from urllib.parse import unquote, urlparse
+    from urllib.parse import unquote
+
+    from src.models.communication import Attachment
 
     engine = get_engine()
-    Session = sessionmaker(bind=engine)
-    session = Session()
+    # Core UPDATE executed as executemany: bypasses the ORM identity map and
+    # attribute history entirely. Empty names keep the existing filename.
+    new_name = bindparam("new_filename")
+    fix_stmt = (
+        update(Attachment)
+        .where(Attachment.id == bindparam("att_id"))
+        .values(
+            mime_type="application/pdf",
+            filename=case((new_name != "", new_name), else_=Attachment.filename),
+        )
+    )
     try:
-        from src.models.communication import Attachment
-
-        # Find attachments where the URL path ends in .pdf but mime_type is wrong
-        candidates = (
-            session.query(Attachment)
-            .filter(
-                Attachment.remote_url.like("%.pdf%"),
-                Attachment.mime_type != "application/pdf",
+        with engine.begin() as conn:
+            # Find attachments where the URL path ends in .pdf but mime_type is wrong.
+            # Stream candidates in chunks so memory stays bounded on large tables.
+            candidates = conn.execution_options(yield_per=_PDF_FIX_BATCH).execute(
+                select(Attachment.id, Attachment.remote_url).where(
+                    Attachment.remote_url.like("%.pdf%"),
+                    Attachment.mime_type.is_distinct_from("application/pdf"),
+                )
             )
-            .all()
-        )
 
-        fixed = 0
-        for att in candidates:
-            try:
-                path = urlparse(att.remote_url).path
+            fixes = []
+            fixed = 0
+            for att_id, remote_url in candidates:
+                # Plain string ops instead of urlparse(): strip query and fragment
+                path = remote_url.split("?", 1)[0].split("#", 1)[0]
                 if path.lower().endswith(".pdf"):
-                    att.mime_type = "application/pdf"
                     # Fix garbled filename too
-                    clean_name = unquote(path.rsplit("/", 1)[-1])
-                    if clean_name:
-                        att.filename = clean_name
-                    fixed += 1
-            except Exception:
-                continue
-
-        if fixed:
-            session.commit()
-            logger.info(f"Fixed mime_type for {fixed} PDF attachment(s)")
+                    name = path.rsplit("/", 1)[-1]
+                    if "%" in name:
+                        name = unquote(name)
+                    fixes.append({"att_id": att_id, "new_filename": name})
+                if len(fixes) >= _PDF_FIX_BATCH:
+                    conn.execute(fix_stmt, fixes)
+                    fixed += len(fixes)
+                    fixes = []
+
+            if fixes:
+                conn.execute(fix_stmt, fixes)
+                fixed += len(fixes)
+            if fixed:
+                logger.info(f"Fixed mime_type for {fixed} PDF attachment(s)")
     except Exception:
-        session.rollback()
         logger.warning("Failed to fix PDF mime types", exc_info=True)
-    finally:
-        session.close()
 
 
-def _migrate_checklist_event_date():
+def _migrate_checklist_event_date(columns: set[str]):
     """Add event_date column to checklist_items table if missing."""
     engine = get_engine()
-    inspector = inspect(engine)
-    columns = [col["name"] for col in inspector.get_columns("checklist_items")]
     if "event_date" not in columns:
         logger.info("Migrating: adding event_date column to checklist_items table")
         with engine.begin() as conn:
@@ -119,11 +178,57 @@ def _migrate_checklist_event_date():
             ))
 
 
+def _migrate_summary_source_hash(columns: set[str]):
+    """Add source_item_hash column to daily_summaries table if missing."""
+    engine = get_engine()
+    if "source_item_hash" not in columns:
+        logger.info("Migrating: adding source_item_hash column to daily_summaries table")
+        with engine.begin() as conn:
+            conn.execute(text("ALTER TABLE daily_summaries ADD COLUMN source_item_hash VARCHAR(32)"))
+
+
+def _migrate_add_indexes():
+    """Create composite indexes added after the tables were first created.
+
+    create_all() skips existing tables entirely, so their new indexes must be
+    created explicitly.
+    """
+    engine = get_engine()
+    with engine.begin() as conn:
+        conn.execute(text(
+            "CREATE INDEX IF NOT EXISTS ix_comm_source_ts_title "
+            "ON communication_items(source, timestamp, title, sender)"
+        ))
+        conn.execute(text(
+            "CREATE INDEX IF NOT EXISTS ix_checklist_cat_checked_event "
+            "ON checklist_items(category, is_checked, event_date)"
+        ))
+
+
 def _backfill_event_dates():
-    """Backfill event_date for checklist items on startup."""
+    """Backfill event_date for checklist items on first startup.
+
+    Completion is recorded as a sync_state row so later launches skip the scan.
+    """
+    engine = get_engine()
     try:
+        with engine.connect() as conn:
+            done = conn.execute(
+                text("SELECT 1 FROM sync_state WHERE source = :flag"),
+                {"flag": _BACKFILL_FLAG},
+            ).first()
+        if done:
+            return
+
         from src.services.date_extractor import backfill_event_dates
-        backfill_event_dates()
+        if not backfill_event_dates():
+            return
+
+        with engine.begin() as conn:
+            conn.execute(
+                text("INSERT OR IGNORE INTO sync_state (source, last_sync_at) VALUES (:flag, :now)"),
+                {"flag": _BACKFILL_FLAG, "now": datetime.now()},
+            )
     except Exception:
         logger.warning("Failed to backfill event dates", exc_info=True)
 
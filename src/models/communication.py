@@ -1,9 +1,10 @@
 """Database models for communications, attachments, sync state, and daily summaries."""
 
-import json
 from datetime import date, datetime
+from functools import cached_property
 
-from sqlalchemy import Date, DateTime, ForeignKey, Index, Integer, String, Text, Boolean
+import orjson
+from sqlalchemy import JSON, Date, DateTime, ForeignKey, Index, Integer, String, Text, Boolean
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from src.models.base import Base
@@ -23,7 +24,7 @@ class CommunicationItem(Base):
 
     # Gmail-specific
     gmail_thread_id: Mapped[str | None] = mapped_column(String(100), nullable=True)
-    gmail_label_ids: Mapped[str | None] = mapped_column(Text, nullable=True)  # JSON list
+    gmail_label_ids: Mapped[list | None] = mapped_column(JSON(none_as_null=True), nullable=True)
     gmail_snippet: Mapped[str | None] = mapped_column(String(500), nullable=True)
 
     # Brightwheel-specific
@@ -38,18 +39,19 @@ class CommunicationItem(Base):
 
     __table_args__ = (
         Index("ix_comm_source_timestamp", "source", "timestamp"),
+        # Covers the list views' source + date-range scans, including title/sender
+        Index("ix_comm_source_ts_title", "source", "timestamp", "title", "sender"),
     )
 
     @property
     def gmail_label_list(self) -> list[str]:
-        if self.gmail_label_ids:
-            return json.loads(self.gmail_label_ids)
-        return []
+        return self.gmail_label_ids or []
 
-    @property
+    @cached_property
     def bw_details_dict(self) -> dict:
+        # bw_details is the write-once raw API payload, so parse it at most once
         if self.bw_details:
-            return json.loads(self.bw_details)
+            return orjson.loads(self.bw_details)
         return {}
 
 
@@ -85,33 +87,55 @@ class DailySummary(Base):
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
     date: Mapped[str] = mapped_column(String(10), nullable=False, unique=True)  # YYYY-MM-DD
-    key_dates: Mapped[str | None] = mapped_column(Text, nullable=True)  # JSON list
-    deadlines: Mapped[str | None] = mapped_column(Text, nullable=True)  # JSON list
-    curriculum_updates: Mapped[str | None] = mapped_column(Text, nullable=True)  # JSON list
-    action_items: Mapped[str | None] = mapped_column(Text, nullable=True)  # JSON list
+    key_dates: Mapped[list | None] = mapped_column(JSON(none_as_null=True), nullable=True)
+    deadlines: Mapped[list | None] = mapped_column(JSON(none_as_null=True), nullable=True)
+    curriculum_updates: Mapped[list | None] = mapped_column(JSON(none_as_null=True), nullable=True)
+    action_items: Mapped[list | None] = mapped_column(JSON(none_as_null=True), nullable=True)
     raw_summary: Mapped[str | None] = mapped_column(Text, nullable=True)
-    source_item_ids: Mapped[str | None] = mapped_column(Text, nullable=True)  # JSON list of IDs
+    source_item_ids: Mapped[list[int] | None] = mapped_column(JSON(none_as_null=True), nullable=True)  # legacy
+    source_item_hash: Mapped[str | None] = mapped_column(String(32), nullable=True)  # BLAKE2b of sorted item ids
     generated_at: Mapped[datetime | None] = mapped_column(DateTime, nullable=True)
 
     @property
     def key_dates_list(self) -> list:
-        return json.loads(self.key_dates) if self.key_dates else []
+        return self.key_dates or []
 
     @property
     def deadlines_list(self) -> list:
-        return json.loads(self.deadlines) if self.deadlines else []
+        return self.deadlines or []
 
     @property
     def curriculum_updates_list(self) -> list:
-        return json.loads(self.curriculum_updates) if self.curriculum_updates else []
+        return self.curriculum_updates or []
 
     @property
     def action_items_list(self) -> list:
-        return json.loads(self.action_items) if self.action_items else []
+        return self.action_items or []
 
     @property
     def source_item_id_list(self) -> list[int]:
-        return json.loads(self.source_item_ids) if self.source_item_ids else []
+        return self.source_item_ids or []
+
+    @property
+    def overview_dict(self) -> dict:
+        """Structured overview from raw_summary; legacy plain text maps to general_bisc.
+
+        Parsed once per raw_summary value and cached on the instance.
+        """
+        raw = self.raw_summary
+        cached = self.__dict__.get("_overview_cache")
+        if cached is not None and cached[0] is raw:
+            return cached[1]
+        overview = {}
+        if raw:
+            try:
+                overview = orjson.loads(raw)
+            except orjson.JSONDecodeError:
+                overview = None
+            if not isinstance(overview, dict):
+                overview = {"general_bisc": raw}
+        self.__dict__["_overview_cache"] = (raw, overview)
+        return overview
 
 
 class ChecklistItem(Base):
@@ -127,3 +151,7 @@ class ChecklistItem(Base):
     source_date: Mapped[str | None] = mapped_column(String(10), nullable=True)  # YYYY-MM-DD
     event_date: Mapped[date | None] = mapped_column(Date, nullable=True, index=True)
     created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.now)
+
+    __table_args__ = (
+        Index("ix_checklist_cat_checked_event", "category", "is_checked", "event_date"),
+    )
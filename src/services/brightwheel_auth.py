@@ -2,16 +2,30 @@
 
 import json
 import logging
+from collections.abc import Mapping
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeout
 from pathlib import Path
+from types import MappingProxyType
 
-from src.config.settings import BW_BASE_URL, BW_LOGIN_TIMEOUT_MS, BW_SESSION_PATH
+from src.config.settings import BW_API_BASE, BW_BASE_URL, BW_LOGIN_TIMEOUT_MS, BW_SESSION_PATH
 
 logger = logging.getLogger(__name__)
 
+# Playwright's sync API is bound to the thread that started it, so all browser
+# work runs on this one long-lived thread and the browser outlives each login
+_BROWSER_THREAD = ThreadPoolExecutor(max_workers=1, thread_name_prefix="playwright")
+
+# How long app shutdown waits for the browser thread; a login still waiting
+# on 2FA can hold it for BW_LOGIN_TIMEOUT_MS
+BROWSER_CLOSE_TIMEOUT_S = 5
+
 
 class BrightwheelAuth:
     """Handles Brightwheel login via Playwright and session persistence."""
 
+    _playwright = None
+    _browsers: dict = {}  # headless flag -> Browser
+
     def __init__(self):
         self._cookies: dict[str, str] = {}
         self._csrf_token: str | None = None
@@ -38,51 +52,100 @@ class BrightwheelAuth:
 
         Returns True on success.
         """
-        from playwright.sync_api import sync_playwright
+        # Warm path: saved cookies still work, no browser needed
+        if self.restore_session() and self._session_is_live():
+            logger.info("Saved session still valid, skipping browser login")
+            return True
 
-        with sync_playwright() as p:
-            # Try restoring saved session first
-            browser_args = {}
-            if BW_SESSION_PATH.exists():
-                browser_args["storage_state"] = str(BW_SESSION_PATH)
-                logger.info("Restoring saved Playwright session")
+        return _BROWSER_THREAD.submit(self._login, email, password, headless).result()
 
-            browser = p.chromium.launch(headless=headless)
-            context = browser.new_context(**browser_args)
-            page = context.new_page()
+    def _login(self, email: str, password: str, headless: bool) -> bool:
+        """Run the Playwright login flow. Must run on the browser thread."""
+        # Try restoring saved session first
+        browser_args = {}
+        if BW_SESSION_PATH.exists():
+            browser_args["storage_state"] = str(BW_SESSION_PATH)
+            logger.info("Restoring saved Playwright session")
 
-            try:
-                # Navigate to login
-                page.goto(f"{BW_BASE_URL}/sign-in", wait_until="networkidle")
-
-                # Check if already logged in (session restored)
-                if "/sign-in" not in page.url:
-                    logger.info("Session restored, already logged in")
-                    self._extract_cookies(context)
-                    self._save_session(context)
-                    return True
-
-                # Fill login form
-                page.fill('input[name="user[email]"]', email)
-                page.fill('input[name="user[password]"]', password)
-                page.click('button[type="submit"]')
-
-                # Wait for navigation away from sign-in (handles 2FA wait)
-                page.wait_for_url(
-                    lambda url: "/sign-in" not in url,
-                    timeout=BW_LOGIN_TIMEOUT_MS,
-                )
-
-                logger.info("Login successful, extracting cookies")
+        context = self.get_browser(headless).new_context(**browser_args)
+        page = context.new_page()
+
+        try:
+            # Navigate to login
+            page.goto(f"{BW_BASE_URL}/sign-in", wait_until="networkidle")
+
+            # Check if already logged in (session restored)
+            if "/sign-in" not in page.url:
+                logger.info("Session restored, already logged in")
                 self._extract_cookies(context)
                 self._save_session(context)
                 return True
 
-            except Exception as e:
-                logger.error(f"Brightwheel login failed: {e}")
-                raise
-            finally:
+            # Fill login form
+            page.fill('input[name="user[email]"]', email)
+            page.fill('input[name="user[password]"]', password)
+            page.click('button[type="submit"]')
+
+            # Wait for navigation away from sign-in (handles 2FA wait)
+            page.wait_for_url(
+                lambda url: "/sign-in" not in url,
+                timeout=BW_LOGIN_TIMEOUT_MS,
+            )
+
+            logger.info("Login successful, extracting cookies")
+            self._extract_cookies(context)
+            self._save_session(context)
+            return True
+
+        except Exception as e:
+            logger.error(f"Brightwheel login failed: {e}")
+            raise
+        finally:
+            context.close()
+
+    @classmethod
+    def get_browser(cls, headless: bool):
+        """Return a cached Chromium instance, launching it on first use.
+
+        Must be called on the browser thread; only a fresh context is
+        created per login, so Chromium starts once per process.
+        """
+        browser = cls._browsers.get(headless)
+        if browser is None or not browser.is_connected():
+            if cls._playwright is None:
+                from playwright.sync_api import sync_playwright
+                cls._playwright = sync_playwright().start()
+            browser = cls._playwright.chromium.launch(headless=headless)
+            cls._browsers[headless] = browser
+        return browser
+
+    @classmethod
+    def close_browser(cls):
+        """Shut down the cached browser(s) and Playwright driver.
+
+        Never blocks the caller (the GUI thread at quit) for longer than
+        BROWSER_CLOSE_TIMEOUT_S, even if a login is still running.
+        """
+        if cls._playwright is None:
+            return
+        future = _BROWSER_THREAD.submit(cls._close_browser)
+        try:
+            future.result(timeout=BROWSER_CLOSE_TIMEOUT_S)
+        except FutureTimeout:
+            logger.warning("Browser thread still busy (login in progress); not waiting for it to close")
+            _BROWSER_THREAD.shutdown(wait=False, cancel_futures=True)
+
+    @classmethod
+    def _close_browser(cls):
+        for browser in cls._browsers.values():
+            try:
                 browser.close()
+            except Exception:
+                pass
+        cls._browsers.clear()
+        if cls._playwright is not None:
+            cls._playwright.stop()
+            cls._playwright = None
 
     def restore_session(self) -> bool:
         """Try to restore session from saved storage state without opening browser."""
@@ -103,6 +166,22 @@ class BrightwheelAuth:
             logger.warning(f"Failed to restore session: {e}")
             return False
 
+    def _session_is_live(self) -> bool:
+        """Check the restored cookies against the API without a browser."""
+        import requests
+
+        try:
+            resp = requests.get(
+                f"{BW_API_BASE}/users/me",
+                cookies=self._cookies,
+                headers=self.get_request_headers(),
+                timeout=10,
+            )
+            return resp.status_code == 200
+        except requests.RequestException as e:
+            logger.debug(f"Session check failed: {e}")
+            return False
+
     def get_request_headers(self) -> dict[str, str]:
         """Return headers needed for direct API requests."""
         headers = {
@@ -115,9 +194,13 @@ class BrightwheelAuth:
             headers["X-CSRF-Token"] = self._csrf_token
         return headers
 
-    def get_cookies_dict(self) -> dict[str, str]:
-        """Return cookies for use with requests library."""
-        return dict(self._cookies)
+    def get_cookies_dict(self) -> Mapping[str, str]:
+        """Return a read-only view of the cookies (no copy)."""
+        return MappingProxyType(self._cookies)
+
+    def apply_to_session(self, session):
+        """Load the cookies into a requests.Session's cookie jar."""
+        session.cookies.update(self._cookies)
 
     def set_manual_cookie(self, cookie_value: str):
         """Manual cookie paste fallback."""
@@ -1,13 +1,21 @@
 """Brightwheel API client using extracted session cookies."""
 
-import json
 import logging
+import threading
+from collections import deque
+from collections.abc import Callable, Iterator
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from urllib.parse import unquote, urlparse
+from functools import lru_cache
+from operator import itemgetter
+from urllib.parse import unquote, urlencode, urlparse
 
+import orjson
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
-from src.config.settings import BW_API_BASE, BW_PAGE_SIZE
+from src.config.settings import BW_API_BASE, BW_PAGE_CACHE_PATH, BW_PAGE_SIZE
 from src.services.brightwheel_auth import BrightwheelAuth
 from src.utils.date_utils import parse_timestamp
 
@@ -21,16 +29,93 @@ def _filename_from_url(url: str, default: str = "attachment") -> str:
     except Exception:
         return default
 
+
+def _activity_created(activity: dict) -> str | None:
+    return activity.get("created_at") or activity.get("event_date")
+
+
+def _message_created(result: dict) -> str | None:
+    msg = result.get("message", result)
+    return msg.get("created_at") or msg.get("date")
+
+
+_name_parts = itemgetter("first_name", "last_name")
+
+
+def _full_name(person: dict) -> str:
+    """Return "first last" for a nested Brightwheel person object."""
+    try:
+        first, last = _name_parts(person)
+    except KeyError:
+        first, last = person.get("first_name", ""), person.get("last_name", "")
+    return f"{first} {last}".strip()
+
+
+@lru_cache(maxsize=None)
+def _activity_title(action_type: str) -> str:
+    """Human-readable title for an action type, e.g. "ac_photo" -> "Photo"."""
+    return action_type.replace("_", " ").replace("ac ", "").title()
+
+
+def _dump_details(payload: dict) -> str:
+    """Serialize a raw API payload for CommunicationItem.bw_details."""
+    return orjson.dumps(payload, default=str, option=orjson.OPT_NON_STR_KEYS).decode()
+
+
+def _is_older(created, since: datetime, since_key: str) -> bool:
+    """Return True if `created` is before `since`.
+
+    UTC "...Z" ISO strings parse to naive datetimes, so their first 19 chars
+    compare lexicographically against `since_key`; only a same-second tie
+    or another format needs a real parse.
+    """
+    if isinstance(created, str) and len(created) >= 20 and created[10] == "T" and created[-1] == "Z":
+        key = created[:19]
+        if key != since_key:
+            return key < since_key
+    try:
+        return parse_timestamp(created) < since
+    except (ValueError, TypeError):
+        return False
+
+
 logger = logging.getLogger(__name__)
 
+# Concurrent page requests per student feed
+PAGE_WORKERS = 4
+# Feeds (activities/messages per student) fetched at once by fetch_all_feeds;
+# with PAGE_WORKERS each, this stays within the adapter's pool_maxsize
+FEED_WORKERS = 6
+
+
+def new_http_session() -> requests.Session:
+    """A requests session with a keep-alive pool and retries for transient GET failures."""
+    session = requests.Session()
+    # Pool sized for concurrent page fetches and PDF downloads
+    session.mount("https://", HTTPAdapter(
+        pool_connections=4,
+        pool_maxsize=32,
+        max_retries=Retry(
+            total=3,
+            backoff_factor=0.3,
+            status_forcelist=(429, 500, 502, 503, 504),
+            allowed_methods=frozenset(["GET"]),
+        ),
+    ))
+    return session
+
 
 class BrightwheelService:
     """Fetches data from Brightwheel's internal API."""
 
-    def __init__(self, auth: BrightwheelAuth):
+    def __init__(self, auth: BrightwheelAuth, session: requests.Session | None = None):
         self._auth = auth
-        self._session = requests.Session()
-        self._session.cookies.update(auth.get_cookies_dict())
+        # ETag -> payload per page URL, for conditional GETs across syncs
+        self._page_cache = self._load_page_cache()
+        self._page_cache_lock = threading.Lock()
+        self._page_cache_dirty = False
+        self._session = session or new_http_session()
+        auth.apply_to_session(self._session)
         self._session.headers.update({
             "Accept": "application/json",
             "Content-Type": "application/json",
@@ -42,7 +127,7 @@ class BrightwheelService:
         """GET /api/v1/users/me -> user info."""
         resp = self._session.get(f"{BW_API_BASE}/users/me")
         resp.raise_for_status()
-        return resp.json()
+        return orjson.loads(resp.content)
 
     def get_students(self, guardian_id: str) -> list[dict]:
         """GET /api/v1/guardians/{id}/students -> list of student entries.
@@ -51,7 +136,7 @@ class BrightwheelService:
         """
         resp = self._session.get(f"{BW_API_BASE}/guardians/{guardian_id}/students")
         resp.raise_for_status()
-        data = resp.json()
+        data = orjson.loads(resp.content)
         return data.get("students", [])
 
     def get_activities(
@@ -61,12 +146,10 @@ class BrightwheelService:
 
         Returns (activities, has_more_pages).
         """
-        resp = self._session.get(
+        data = self._get_page(
             f"{BW_API_BASE}/students/{student_id}/activities",
-            params={"page": page, "per_page": page_size},
+            {"page": page, "per_page": page_size},
         )
-        resp.raise_for_status()
-        data = resp.json()
 
         activities = data.get("activities", [])
         has_more = len(activities) >= page_size
@@ -79,75 +162,169 @@ class BrightwheelService:
 
         Returns (messages, has_more).
         """
-        resp = self._session.get(
+        data = self._get_page(
             f"{BW_API_BASE}/students/{student_id}/messages",
-            params={"page": page, "page_size": page_size},
+            {"page": page, "page_size": page_size},
         )
-        resp.raise_for_status()
-        data = resp.json()
 
         results = data.get("results", [])
         has_more = data.get("has_more", False)
         return results, has_more
 
+    def _get_page(self, url: str, params: dict) -> dict:
+        """GET a feed page, revalidating with If-None-Match when it was seen before.
+
+        On 304 the payload stored with the matching ETag is returned, so
+        unchanged pages skip the transfer and JSON parse.
+        """
+        key = f"{url}?{urlencode(params)}"
+        cached = self._page_cache.get(key)
+        headers = {"If-None-Match": cached["etag"]} if cached else None
+        resp = self._session.get(url, params=params, headers=headers)
+        if resp.status_code == 304 and cached:
+            return cached["data"]
+        resp.raise_for_status()
+        # Parse the body bytes directly; resp.json() would first decode to str
+        # (sniffing the charset when none is declared) and then use stdlib json
+        data = orjson.loads(resp.content)
+
+        etag = resp.headers.get("ETag")
+        if etag:
+            with self._page_cache_lock:
+                self._page_cache[key] = {"etag": etag, "data": data}
+                self._page_cache_dirty = True
+        return data
+
+    @staticmethod
+    def _load_page_cache() -> dict:
+        try:
+            return orjson.loads(BW_PAGE_CACHE_PATH.read_bytes())
+        except FileNotFoundError:
+            return {}
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable page cache: {e}")
+            return {}
+
+    def save_page_cache(self):
+        """Write new ETag entries to disk, if any.
+
+        fetch_all_feeds calls this once per sync; callers iterating single
+        feeds directly should call it when they are done.
+        """
+        with self._page_cache_lock:
+            if not self._page_cache_dirty:
+                return
+            try:
+                tmp = BW_PAGE_CACHE_PATH.with_suffix(".tmp")
+                tmp.write_bytes(orjson.dumps(self._page_cache))
+                tmp.replace(BW_PAGE_CACHE_PATH)
+                self._page_cache_dirty = False
+            except OSError as e:
+                logger.warning(f"Failed to save page cache: {e}")
+
+    def iter_activities(
+        self, student_id: str, since: datetime | None = None, max_pages: int = 20
+    ) -> Iterator[dict]:
+        """Yield activities for a student newest first, optionally since a given date."""
+        return self._iter_pages(
+            lambda page: self.get_activities(student_id, page=page),
+            _activity_created,
+            since,
+            max_pages,
+        )
+
+    def iter_messages(
+        self, student_id: str, since: datetime | None = None, max_pages: int = 20
+    ) -> Iterator[dict]:
+        """Yield messages for a student newest first, optionally since a given date."""
+        return self._iter_pages(
+            lambda page: self.get_messages(student_id, page=page),
+            _message_created,
+            since,
+            max_pages,
+        )
+
     def fetch_all_activities(
         self, student_id: str, since: datetime | None = None, max_pages: int = 20
     ) -> list[dict]:
         """Fetch all activities for a student, optionally since a given date."""
-        all_activities = []
-        page = 1
-
-        while page <= max_pages:
-            activities, has_more = self.get_activities(student_id, page=page)
-            if not activities:
-                break
-
-            for activity in activities:
-                created = activity.get("created_at") or activity.get("event_date")
-                if since and created:
-                    try:
-                        ts = parse_timestamp(created)
-                        if ts < since:
-                            return all_activities
-                    except (ValueError, TypeError):
-                        pass
-                all_activities.append(activity)
-
-            if not has_more:
-                break
-            page += 1
-
-        return all_activities
+        return list(self.iter_activities(student_id, since=since, max_pages=max_pages))
 
     def fetch_all_messages(
         self, student_id: str, since: datetime | None = None, max_pages: int = 20
     ) -> list[dict]:
         """Fetch all messages for a student, optionally since a given date."""
-        all_messages = []
-        page = 1
-
-        while page <= max_pages:
-            results, has_more = self.get_messages(student_id, page=page)
-            if not results:
-                break
-
-            for result in results:
-                msg = result.get("message", result)
-                created = msg.get("created_at") or msg.get("date")
-                if since and created:
-                    try:
-                        ts = parse_timestamp(created)
-                        if ts < since:
-                            return all_messages
-                    except (ValueError, TypeError):
-                        pass
-                all_messages.append(result)
-
-            if not has_more:
-                break
-            page += 1
-
-        return all_messages
+        return list(self.iter_messages(student_id, since=since, max_pages=max_pages))
+
+    def fetch_all_feeds(
+        self, student_ids: list[str], since: datetime | None = None, max_pages: int = 20
+    ) -> dict[str, tuple[list[dict], list[dict]]]:
+        """Fetch activities and messages for several students concurrently.
+
+        All feeds share this service's pooled session, so requests reuse the
+        same keep-alive connections. The page cache is written once, after
+        every feed has finished. Returns {student_id: (activities, messages)}.
+        """
+        if not student_ids:
+            return {}
+        try:
+            with ThreadPoolExecutor(max_workers=FEED_WORKERS) as pool:
+                futures = {
+                    student_id: (
+                        pool.submit(self.fetch_all_activities, student_id, since, max_pages),
+                        pool.submit(self.fetch_all_messages, student_id, since, max_pages),
+                    )
+                    for student_id in student_ids
+                }
+                return {
+                    student_id: (activities.result(), messages.result())
+                    for student_id, (activities, messages) in futures.items()
+                }
+        finally:
+            self.save_page_cache()
+
+    def _iter_pages(
+        self,
+        fetch_page: Callable[[int], tuple[list[dict], bool]],
+        created_of: Callable[[dict], str | None],
+        since: datetime | None,
+        max_pages: int,
+        workers: int = PAGE_WORKERS,
+    ) -> Iterator[dict]:
+        """Yield items page by page, keeping up to `workers` page requests in flight.
+
+        The next page is requested before the current page's items are yielded,
+        so network I/O overlaps with the consumer. Stops at the first empty page,
+        the last page (has_more False), or the first item older than `since`
+        (results are newest first); queued prefetches are cancelled.
+        """
+        since_key = since.strftime("%Y-%m-%dT%H:%M:%S") if since else None
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            window = deque(
+                pool.submit(fetch_page, page) for page in range(1, min(workers, max_pages) + 1)
+            )
+            next_page = len(window) + 1
+            try:
+                while window:
+                    items, has_more = window.popleft().result()
+                    if not items:
+                        return
+
+                    if has_more and next_page <= max_pages:
+                        window.append(pool.submit(fetch_page, next_page))
+                        next_page += 1
+
+                    for item in items:
+                        created = created_of(item)
+                        if since and created and _is_older(created, since, since_key):
+                            return
+                        yield item
+
+                    if not has_more:
+                        return
+            finally:
+                for future in window:
+                    future.cancel()
 
     @staticmethod
     def parse_activity(activity: dict, student_name: str = "") -> dict:
@@ -157,7 +334,7 @@ class BrightwheelService:
         # Actor name from nested object
         actor = activity.get("actor", {})
         if isinstance(actor, dict):
-            actor_name = f"{actor.get('first_name', '')} {actor.get('last_name', '')}".strip()
+            actor_name = _full_name(actor)
         else:
             actor_name = str(actor)
 
@@ -166,7 +343,7 @@ class BrightwheelService:
         room_name = room.get("name", "") if isinstance(room, dict) else ""
 
         # Build title
-        title = action_type.replace("_", " ").replace("ac ", "").title()
+        title = _activity_title(action_type)
         if student_name:
             title = f"{student_name}: {title}"
 
@@ -216,7 +393,7 @@ class BrightwheelService:
             "student_name": student_name,
             "room": room_name,
             "action_type": action_type,
-            "details": json.dumps(activity, default=str),
+            "details": _dump_details(activity),
             "photos": photos,
             "attachment_list": attachment_list,
         }
@@ -229,7 +406,7 @@ class BrightwheelService:
         # Sender info
         sender = msg.get("sender", {})
         if isinstance(sender, dict):
-            sender_name = f"{sender.get('first_name', '')} {sender.get('last_name', '')}".strip()
+            sender_name = _full_name(sender)
         else:
             sender_name = str(sender) if sender else ""
 
@@ -267,7 +444,7 @@ class BrightwheelService:
             "student_name": student_name,
             "room": "",
             "action_type": msg_type,
-            "details": json.dumps(result, default=str),
+            "details": _dump_details(result),
             "photos": photos,
             "attachment_list": attachment_list,
         }
@@ -1,10 +1,15 @@
 """Persistent checklist service for action items and key dates."""
 
 import calendar
-import difflib
 import logging
+from collections.abc import Iterator
+from contextlib import contextmanager
 from datetime import date, datetime, timedelta
 
+from rapidfuzz import fuzz, process
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
 from src.models.base import get_session
 from src.models.communication import ChecklistItem
 
@@ -14,88 +19,80 @@ MATCH_THRESHOLD = 0.75
 
 
 class ChecklistService:
-    """Manages persistent checklist items that carry across syncs."""
+    """Manages persistent checklist items that carry across syncs.
 
-    def get_checklist_items(self, category: str) -> list[ChecklistItem]:
-        """Return all checklist items for a category, ordered by creation date."""
+    Reads and check-state updates take an optional ``session``; pass the one yielded by
+    ``scope()`` to run several calls on a single session and transaction.
+    Without it, each call opens, commits and closes its own.
+    """
+
+    @contextmanager
+    def scope(self) -> Iterator[Session]:
+        """Yield one session for a sequence of calls, committing at the end."""
         session = get_session()
         try:
-            items = (
-                session.query(ChecklistItem)
-                .filter_by(category=category)
-                .order_by(ChecklistItem.created_at)
-                .all()
-            )
-            for item in items:
-                session.expunge(item)
-            return items
+            yield session
+            session.commit()
+        except Exception:
+            session.rollback()
+            raise
         finally:
+            # close() detaches loaded items so callers can keep using them
             session.close()
 
-    def get_unchecked_items(self, category: str) -> list[ChecklistItem]:
+    @contextmanager
+    def _session_scope(self, session: Session | None) -> Iterator[Session]:
+        if session is not None:
+            yield session
+        else:
+            with self.scope() as session:
+                yield session
+
+    def get_checklist_items(self, category: str, session: Session | None = None) -> list[ChecklistItem]:
+        """Return all checklist items for a category, ordered by creation date."""
+        with self._session_scope(session) as session:
+            return session.scalars(
+                select(ChecklistItem)
+                .filter_by(category=category)
+                .order_by(ChecklistItem.created_at, ChecklistItem.id)
+            ).all()
+
+    def get_unchecked_items(self, category: str, session: Session | None = None) -> list[ChecklistItem]:
         """Return unchecked checklist items for a category."""
-        session = get_session()
-        try:
-            items = (
-                session.query(ChecklistItem)
+        with self._session_scope(session) as session:
+            return session.scalars(
+                select(ChecklistItem)
                 .filter_by(category=category, is_checked=False)
-                .order_by(ChecklistItem.created_at)
-                .all()
-            )
-            for item in items:
-                session.expunge(item)
-            return items
-        finally:
-            session.close()
+                .order_by(ChecklistItem.created_at, ChecklistItem.id)
+            ).all()
 
-    def get_checked_items(self, category: str) -> list[ChecklistItem]:
+    def get_checked_items(self, category: str, session: Session | None = None) -> list[ChecklistItem]:
         """Return checked (archived) checklist items for a category."""
-        session = get_session()
-        try:
-            items = (
-                session.query(ChecklistItem)
+        with self._session_scope(session) as session:
+            return session.scalars(
+                select(ChecklistItem)
                 .filter_by(category=category, is_checked=True)
                 .order_by(ChecklistItem.checked_at.desc())
-                .all()
-            )
-            for item in items:
-                session.expunge(item)
-            return items
-        finally:
-            session.close()
+            ).all()
 
-    def toggle_item(self, item_id: int) -> bool:
+    def toggle_item(self, item_id: int, session: Session | None = None) -> bool:
         """Toggle the checked state of an item. Returns new checked state."""
-        session = get_session()
-        try:
-            item = session.query(ChecklistItem).get(item_id)
+        with self._session_scope(session) as session:
+            item = session.get(ChecklistItem, item_id)
             if not item:
                 return False
             item.is_checked = not item.is_checked
             item.checked_at = datetime.now() if item.is_checked else None
-            session.commit()
             return item.is_checked
-        except Exception:
-            session.rollback()
-            raise
-        finally:
-            session.close()
 
-    def set_item_checked(self, item_id: int, checked: bool):
+    def set_item_checked(self, item_id: int, checked: bool, session: Session | None = None):
         """Explicitly set the checked state of an item."""
-        session = get_session()
-        try:
-            item = session.query(ChecklistItem).get(item_id)
+        with self._session_scope(session) as session:
+            item = session.get(ChecklistItem, item_id)
             if not item:
                 return
             item.is_checked = checked
             item.checked_at = datetime.now() if checked else None
-            session.commit()
-        except Exception:
-            session.rollback()
-            raise
-        finally:
-            session.close()
 
     def sync_items_from_summary(self, category: str, new_texts: list[str]):
         """Sync new summary items against existing checklist items.
@@ -106,61 +103,79 @@ class ChecklistService:
         """
         session = get_session()
         try:
+            # Only the columns needed for matching; rows are never mutated
             existing = (
-                session.query(ChecklistItem)
+                session.query(ChecklistItem.id, ChecklistItem.item_text, ChecklistItem.is_checked)
                 .filter_by(category=category)
                 .all()
             )
 
-            existing_map = {item.id: item for item in existing}
             matched_existing_ids = set()
             matched_new_indices = set()
 
-            # Match new texts against existing items using fuzzy matching
+            # Existing texts, lowercased once
+            candidates = {row.id: row.item_text.lower() for row in existing}
+
+            # Score every (new, existing) pair above the threshold in one pass
+            pairs = []
             for new_idx, new_text in enumerate(new_texts):
-                best_match_id = None
-                best_ratio = 0.0
-
-                for item_id, item in existing_map.items():
-                    if item_id in matched_existing_ids:
-                        continue
-                    ratio = difflib.SequenceMatcher(
-                        None, item.item_text.lower(), new_text.lower()
-                    ).ratio()
-                    if ratio > best_ratio and ratio >= MATCH_THRESHOLD:
-                        best_ratio = ratio
-                        best_match_id = item_id
-
-                if best_match_id is not None:
-                    # Update text but preserve checked state
-                    matched_existing_ids.add(best_match_id)
-                    matched_new_indices.add(new_idx)
-                    existing_map[best_match_id].item_text = new_text
+                for _, score, item_id in process.extract(
+                    new_text.lower(),
+                    candidates,
+                    scorer=fuzz.ratio,
+                    score_cutoff=MATCH_THRESHOLD * 100,
+                    limit=None,
+                ):
+                    pairs.append((score, new_idx, item_id))
+
+            # Assign the strongest pairs first so two similar new texts can't
+            # steal each other's best match based on list order
+            pairs.sort(key=lambda pair: pair[0], reverse=True)
+            updates = []
+            for _, new_idx, item_id in pairs:
+                if new_idx in matched_new_indices or item_id in matched_existing_ids:
+                    continue
+                # Update text but preserve checked state
+                matched_existing_ids.add(item_id)
+                matched_new_indices.add(new_idx)
+                updates.append({"id": item_id, "item_text": new_texts[new_idx]})
 
             # Add new items that didn't match anything
             from src.services.date_extractor import extract_event_date
-            for new_idx, new_text in enumerate(new_texts):
-                if new_idx not in matched_new_indices:
-                    new_item = ChecklistItem(
-                        category=category,
-                        item_text=new_text,
-                        is_checked=False,
-                        created_at=datetime.now(),
-                        event_date=extract_event_date(new_text),
-                    )
-                    session.add(new_item)
+            now = datetime.now()
+            new_items = [
+                ChecklistItem(
+                    category=category,
+                    item_text=new_text,
+                    is_checked=False,
+                    created_at=now,
+                    event_date=extract_event_date(new_text),
+                )
+                for new_idx, new_text in enumerate(new_texts)
+                if new_idx not in matched_new_indices
+            ]
 
             # Remove unmatched unchecked items (they disappeared from summaries)
             # But keep checked items even if they disappeared
-            for item_id, item in existing_map.items():
-                if item_id not in matched_existing_ids and not item.is_checked:
-                    session.delete(item)
+            ids_to_delete = [
+                row.id for row in existing
+                if row.id not in matched_existing_ids and not row.is_checked
+            ]
+
+            # One statement per operation instead of one per item
+            if updates:
+                session.bulk_update_mappings(ChecklistItem, updates)
+            if new_items:
+                session.bulk_save_objects(new_items)
+            if ids_to_delete:
+                session.query(ChecklistItem).filter(
+                    ChecklistItem.id.in_(ids_to_delete)
+                ).delete(synchronize_session=False)
 
             session.commit()
             logger.info(
                 f"Checklist sync [{category}]: {len(matched_existing_ids)} matched, "
-                f"{len(new_texts) - len(matched_new_indices)} added, "
-                f"{sum(1 for iid in existing_map if iid not in matched_existing_ids and not existing_map[iid].is_checked)} removed"
+                f"{len(new_items)} added, {len(ids_to_delete)} removed"
             )
         except Exception:
             session.rollback()
@@ -168,77 +183,53 @@ class ChecklistService:
         finally:
             session.close()
 
-    def get_items_for_month(self, year: int, month: int) -> list[ChecklistItem]:
+    def get_items_for_month(
+        self, year: int, month: int, session: Session | None = None
+    ) -> list[ChecklistItem]:
         """Return all checklist items with event_date in the given month."""
-        session = get_session()
-        try:
+        with self._session_scope(session) as session:
             first_day = date(year, month, 1)
             last_day = date(year, month, calendar.monthrange(year, month)[1])
-            items = (
-                session.query(ChecklistItem)
+            return session.scalars(
+                select(ChecklistItem)
                 .filter(
                     ChecklistItem.event_date >= first_day,
                     ChecklistItem.event_date <= last_day,
                 )
                 .order_by(ChecklistItem.event_date)
-                .all()
-            )
-            for item in items:
-                session.expunge(item)
-            return items
-        finally:
-            session.close()
+            ).all()
 
-    def get_items_for_range(self, start_date: date, end_date: date) -> list[ChecklistItem]:
+    def get_items_for_range(
+        self, start_date: date, end_date: date, session: Session | None = None
+    ) -> list[ChecklistItem]:
         """Return all checklist items with event_date in the given range."""
-        session = get_session()
-        try:
-            items = (
-                session.query(ChecklistItem)
+        with self._session_scope(session) as session:
+            return session.scalars(
+                select(ChecklistItem)
                 .filter(
                     ChecklistItem.event_date >= start_date,
                     ChecklistItem.event_date <= end_date,
                 )
                 .order_by(ChecklistItem.event_date)
-                .all()
-            )
-            for item in items:
-                session.expunge(item)
-            return items
-        finally:
-            session.close()
+            ).all()
 
-    def get_undated_items(self, category: str) -> list[ChecklistItem]:
+    def get_undated_items(self, category: str, session: Session | None = None) -> list[ChecklistItem]:
         """Return items with no event_date for a category."""
-        session = get_session()
-        try:
-            items = (
-                session.query(ChecklistItem)
+        with self._session_scope(session) as session:
+            return session.scalars(
+                select(ChecklistItem)
                 .filter(
                     ChecklistItem.category == category,
                     ChecklistItem.event_date.is_(None),
                     ChecklistItem.is_checked == False,
                 )
-                .order_by(ChecklistItem.created_at)
-                .all()
-            )
-            for item in items:
-                session.expunge(item)
-            return items
-        finally:
-            session.close()
+                .order_by(ChecklistItem.created_at, ChecklistItem.id)
+            ).all()
 
-    def set_event_date(self, item_id: int, event_date: date | None):
+    def set_event_date(self, item_id: int, event_date: date | None, session: Session | None = None):
         """Manually set or clear the event_date for a checklist item."""
-        session = get_session()
-        try:
-            item = session.query(ChecklistItem).get(item_id)
+        with self._session_scope(session) as session:
+            item = session.get(ChecklistItem, item_id)
             if not item:
                 return
             item.event_date = event_date
-            session.commit()
-        except Exception:
-            session.rollback()
-            raise
-        finally:
-            session.close()
@@ -1,6 +1,7 @@
 """Secure credential storage using Windows Credential Locker via keyring."""
 
 import json
+from functools import lru_cache
 
 import keyring
 
@@ -10,56 +11,78 @@ from src.config.settings import KEYRING_SERVICE
 _BW_EMAIL_KEY = "brightwheel_email"
 _BW_PASSWORD_KEY = "brightwheel_password"
 _CLAUDE_API_KEY = "claude_api_key"
+_WA_GROUPS_KEY = "whatsapp_groups"
+
+
+@lru_cache(maxsize=None)
+def _get_password(key: str) -> str | None:
+    """Read a keyring entry once; each lookup is an IPC to the OS credential store."""
+    return keyring.get_password(KEYRING_SERVICE, key)
+
+
+def _set_password(key: str, value: str):
+    keyring.set_password(KEYRING_SERVICE, key, value)
+    _clear_cache()
+
+
+def _delete_password(key: str):
+    try:
+        keyring.delete_password(KEYRING_SERVICE, key)
+    except keyring.errors.PasswordDeleteError:
+        pass
+    _clear_cache()
+
+
+def _clear_cache():
+    _get_password.cache_clear()
+    _parsed_wa_groups.cache_clear()
 
 
 def get_bw_email() -> str | None:
-    return keyring.get_password(KEYRING_SERVICE, _BW_EMAIL_KEY)
+    return _get_password(_BW_EMAIL_KEY)
 
 
 def set_bw_email(email: str):
-    keyring.set_password(KEYRING_SERVICE, _BW_EMAIL_KEY, email)
+    _set_password(_BW_EMAIL_KEY, email)
 
 
 def get_bw_password() -> str | None:
-    return keyring.get_password(KEYRING_SERVICE, _BW_PASSWORD_KEY)
+    return _get_password(_BW_PASSWORD_KEY)
 
 
 def set_bw_password(password: str):
-    keyring.set_password(KEYRING_SERVICE, _BW_PASSWORD_KEY, password)
+    _set_password(_BW_PASSWORD_KEY, password)
 
 
 def get_claude_api_key() -> str | None:
-    return keyring.get_password(KEYRING_SERVICE, _CLAUDE_API_KEY)
+    return _get_password(_CLAUDE_API_KEY)
 
 
 def set_claude_api_key(api_key: str):
-    keyring.set_password(KEYRING_SERVICE, _CLAUDE_API_KEY, api_key)
+    _set_password(_CLAUDE_API_KEY, api_key)
 
 
 def delete_bw_credentials():
-    try:
-        keyring.delete_password(KEYRING_SERVICE, _BW_EMAIL_KEY)
-    except keyring.errors.PasswordDeleteError:
-        pass
-    try:
-        keyring.delete_password(KEYRING_SERVICE, _BW_PASSWORD_KEY)
-    except keyring.errors.PasswordDeleteError:
-        pass
+    _delete_password(_BW_EMAIL_KEY)
+    _delete_password(_BW_PASSWORD_KEY)
 
 
 def delete_claude_api_key():
-    try:
-        keyring.delete_password(KEYRING_SERVICE, _CLAUDE_API_KEY)
-    except keyring.errors.PasswordDeleteError:
-        pass
+    _delete_password(_CLAUDE_API_KEY)
+
+
+@lru_cache(maxsize=1)
+def _parsed_wa_groups() -> tuple[str, ...]:
+    raw = _get_password(_WA_GROUPS_KEY)
+    return tuple(json.loads(raw)) if raw else ()
 
 
 def get_wa_groups() -> list[str]:
     """Get configured WhatsApp group names."""
-    raw = keyring.get_password(KEYRING_SERVICE, "whatsapp_groups")
-    return json.loads(raw) if raw else []
+    # Fresh list each call so callers can't mutate the cached value
+    return list(_parsed_wa_groups())
 
 
 def set_wa_groups(groups: list[str]):
     """Save configured WhatsApp group names."""
-    keyring.set_password(KEYRING_SERVICE, "whatsapp_groups", json.dumps(groups))
+    _set_password(_WA_GROUPS_KEY, json.dumps(groups))
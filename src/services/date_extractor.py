@@ -1,59 +1,163 @@
 """Date extraction service for populating event_date on checklist items."""
 
+import json
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from datetime import date
+from functools import lru_cache
 
-from src.utils.date_parser import extract_date_from_text
+import orjson
+
+from src.utils.date_parser import extract_date_from_text, may_contain_date
 
 logger = logging.getLogger(__name__)
 
+# Items sent to Claude per backfill request; keeps the reply well under max_tokens
+CLAUDE_BATCH_SIZE = 50
+# Parallel single-item requests when a batched reply can't be used
+CLAUDE_CONCURRENCY = 10
+
+# Decodes the first JSON value in a reply and ignores any prose after it
+_JSON_DECODER = json.JSONDecoder()
+
+
+@lru_cache(maxsize=1)
+def _get_client(api_key: str):
+    """Return a shared Anthropic client so connections are reused across calls."""
+    import anthropic
+    return anthropic.Anthropic(api_key=api_key)
+
+
+def _claude_client():
+    """Return the shared client, or None when no API key is configured."""
+    try:
+        from src.services.credential_manager import get_claude_api_key
+        api_key = get_claude_api_key()
+        return _get_client(api_key) if api_key else None
+    except Exception:
+        logger.debug("Claude client unavailable", exc_info=True)
+        return None
+
+
+def _parse_iso(value) -> date | None:
+    """Parse one reply entry; anything but an ISO date string gives None."""
+    if not isinstance(value, str) or value.strip().lower() == "none":
+        return None
+    try:
+        return date.fromisoformat(value.strip())
+    except ValueError:
+        return None
+
+
+def _claude_extract_dates(client, texts: list[str], today: date) -> list[date | None]:
+    """Ask Claude for the event dates of several texts in one request.
+
+    Returns a list aligned with ``texts``; entries are None where no date was found.
+    """
+    from src.config.settings import CLAUDE_MODEL
+
+    numbered = "\n".join(f"{i}. {text}" for i, text in enumerate(texts, 1))
+    response = client.messages.create(
+        model=CLAUDE_MODEL,
+        max_tokens=16 * len(texts) + 32,
+        messages=[{
+            "role": "user",
+            "content": (
+                f"Today is {today.isoformat()}. "
+                f"For each numbered item below, extract the event date. Return ONLY a JSON array "
+                f"with exactly {len(texts)} entries in the same order, each an ISO date (YYYY-MM-DD) "
+                f"or \"none\":\n{numbered}"
+            ),
+        }],
+    )
+    text = response.content[0].text.strip()
+    try:
+        values = orjson.loads(text)
+    except orjson.JSONDecodeError:
+        # Model wrapped the array in prose; decode from the first bracket
+        start = text.find("[")
+        values = _JSON_DECODER.raw_decode(text, start)[0] if start != -1 else []
+    if not isinstance(values, list):
+        raise ValueError(f"Claude returned {type(values).__name__} instead of a list of dates")
+    if len(values) != len(texts):
+        raise ValueError(f"Claude returned {len(values)} dates for {len(texts)} items")
+    return [_parse_iso(v) for v in values]
+
+
+def _claude_extract_date(client, item_text: str, today: date) -> date | None:
+    """Ask Claude for the event date of a single text."""
+    from src.config.settings import CLAUDE_MODEL
+
+    response = client.messages.create(
+        model=CLAUDE_MODEL,
+        max_tokens=20,
+        messages=[{
+            "role": "user",
+            "content": (
+                f"Today is {today.isoformat()}. "
+                f"Extract the event date from this text and return ONLY an ISO date (YYYY-MM-DD) or 'none':\n"
+                f"{item_text}"
+            ),
+        }],
+    )
+    return _parse_iso(response.content[0].text)
+
+
+def _claude_extract_dates_parallel(client, texts: list[str], today: date) -> tuple[list[date | None], int]:
+    """Fallback for a failed batch: one request per text, CLAUDE_CONCURRENCY at a time.
+
+    Returns the dates aligned with ``texts`` and the number of requests that failed.
+    """
+    failed = 0
+
+    def extract(text: str) -> date | None:
+        nonlocal failed
+        try:
+            return _claude_extract_date(client, text, today)
+        except Exception:
+            logger.debug("Claude date extraction failed for: %s", text, exc_info=True)
+            failed += 1
+            return None
+
+    with ThreadPoolExecutor(max_workers=min(CLAUDE_CONCURRENCY, len(texts))) as pool:
+        dates = list(pool.map(extract, texts))
+    return dates, failed
+
 
 def extract_event_date(item_text: str, reference_date: date | None = None) -> date | None:
     """Extract an event date from checklist item text.
 
     Step 1: Use regex-based extraction from date_parser.
-    Step 2: If regex fails and Claude API key is available, use Claude.
+    Step 2: If regex fails, the text looks date-ish, and a Claude API key is
+    available, use Claude.
     """
     ref_year = reference_date.year if reference_date else None
     result = extract_date_from_text(item_text, reference_year=ref_year)
     if result:
         return result
+    if not may_contain_date(item_text):
+        return None
 
     # Step 2: Try Claude API for harder-to-parse dates
     try:
-        from src.services.credential_manager import get_claude_api_key
-        api_key = get_claude_api_key()
-        if not api_key:
+        client = _claude_client()
+        if client is None:
             return None
 
-        import anthropic
-        from src.config.settings import CLAUDE_MODEL
-
-        client = anthropic.Anthropic(api_key=api_key)
-        today = reference_date or date.today()
-        response = client.messages.create(
-            model=CLAUDE_MODEL,
-            max_tokens=20,
-            messages=[{
-                "role": "user",
-                "content": (
-                    f"Today is {today.isoformat()}. "
-                    f"Extract the event date from this text and return ONLY an ISO date (YYYY-MM-DD) or 'none':\n"
-                    f"{item_text}"
-                ),
-            }],
-        )
-        text = response.content[0].text.strip()
-        if text and text != "none":
-            return date.fromisoformat(text)
+        return _claude_extract_date(client, item_text, reference_date or date.today())
     except Exception:
         logger.debug("Claude date extraction failed for: %s", item_text, exc_info=True)
 
     return None
 
 
-def backfill_event_dates():
-    """Backfill event_date for all checklist items where it is NULL."""
+def backfill_event_dates() -> bool:
+    """Backfill event_date for all checklist items where it is NULL.
+
+    Returns True if the backfill ran to completion. Returns False when
+    date-ish items still need Claude (no API key, or requests failed) so the
+    caller does not record the backfill as done.
+    """
     from src.models.base import get_session
     from src.models.communication import ChecklistItem
 
@@ -65,20 +169,50 @@ def backfill_event_dates():
             .all()
         )
         if not items:
-            return
+            return True
 
+        # Regex pass first; only date-ish leftovers need Claude
         updated = 0
+        remaining = []
         for item in items:
-            event_date = extract_event_date(item.item_text)
+            event_date = extract_date_from_text(item.item_text)
             if event_date:
                 item.event_date = event_date
                 updated += 1
+            elif may_contain_date(item.item_text):
+                remaining.append(item)
+
+        # Only report completion (which lets the caller record the backfill as
+        # done) when every date-ish item actually got an answer from Claude
+        complete = True
+        client = _claude_client() if remaining else None
+        if remaining and client is None:
+            logger.info(f"No Claude client; {len(remaining)} checklist item(s) left for a later backfill")
+            complete = False
+        if client is not None:
+            today = date.today()
+            for start in range(0, len(remaining), CLAUDE_BATCH_SIZE):
+                batch = remaining[start:start + CLAUDE_BATCH_SIZE]
+                texts = [i.item_text for i in batch]
+                try:
+                    dates = _claude_extract_dates(client, texts, today)
+                except Exception:
+                    logger.debug("Claude batch date extraction failed; retrying per item", exc_info=True)
+                    dates, failed = _claude_extract_dates_parallel(client, texts, today)
+                    if failed:
+                        complete = False
+                for item, event_date in zip(batch, dates):
+                    if event_date:
+                        item.event_date = event_date
+                        updated += 1
 
         if updated:
             session.commit()
             logger.info(f"Backfilled event_date for {updated} checklist item(s)")
+        return complete
     except Exception:
         session.rollback()
         logger.warning("Failed to backfill event dates", exc_info=True)
+        return False
     finally:
         session.close()
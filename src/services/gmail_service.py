@@ -3,13 +3,21 @@
 import base64
 import email.utils
 import logging
+import threading
+import time
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
 from pathlib import Path
+from typing import Literal
 
+import google_auth_httplib2
+import httplib2
 from google.auth.transport.requests import Request
 from google.oauth2.credentials import Credentials
 from google_auth_oauthlib.flow import InstalledAppFlow
 from googleapiclient.discovery import build
+from googleapiclient.errors import HttpError
 
 from src.config.settings import (
     ATTACHMENTS_DIR,
@@ -22,6 +30,57 @@ from src.config.gmail_query import build_gmail_query
 
 logger = logging.getLogger(__name__)
 
+# Gmail accepts up to 100 calls per batch request; smaller batches stay clear
+# of per-user concurrency limits
+GMAIL_BATCH_SIZE = 50
+
+# Headers requested by fetch_messages(fetch_mode="metadata")
+METADATA_HEADERS = ["From", "Subject", "Date", "Message-ID"]
+
+# Parallel attachment downloads; Gmail allows ~15 concurrent requests per user
+ATTACHMENT_WORKERS = 6
+# Rate-limit / server errors are retried with exponential backoff (1s, 2s, 4s...)
+_BACKOFF_STATUSES = (429, 500, 503)
+_BACKOFF_ATTEMPTS = 6
+_BACKOFF_MAX_DELAY = 60
+
+# Base64 slice decoded per write when saving attachments (multiple of 4)
+_B64_CHUNK = 1024 * 1024
+
+# Lower-cased headers read by parse_message
+_PARSED_HEADERS = frozenset({"subject", "from"})
+
+# Body part mime types -> key in parse_message's parts store
+_TEXT_PART_KINDS = {"text/plain": "plain", "text/html": "html"}
+
+
+def _retry_delay(error: Exception, attempt: int) -> float | None:
+    """Seconds to wait before retry `attempt` + 1, or None if `error` is final.
+
+    Honors a numeric Retry-After header when the server sends one.
+    """
+    if not isinstance(error, HttpError) or error.resp.status not in _BACKOFF_STATUSES:
+        return None
+    if attempt >= _BACKOFF_ATTEMPTS:
+        return None
+    retry_after = error.resp.get("retry-after", "")
+    if retry_after.isdigit():
+        return min(int(retry_after), _BACKOFF_MAX_DELAY)
+    return min(2 ** (attempt - 1), _BACKOFF_MAX_DELAY)
+
+
+def _save_token(creds: Credentials):
+    """Write the token file atomically, skipping the write if it is unchanged."""
+    token_json = creds.to_json()
+    try:
+        if GOOGLE_TOKEN_PATH.read_text() == token_json:
+            return
+    except OSError:
+        pass
+    tmp = GOOGLE_TOKEN_PATH.with_suffix(".tmp")
+    tmp.write_text(token_json)
+    tmp.replace(GOOGLE_TOKEN_PATH)
+
 
 class GmailService:
     """Handles Gmail OAuth2 and message retrieval."""
@@ -29,6 +88,7 @@ class GmailService:
     def __init__(self):
         self._service = None
         self._creds = None
+        self._local = threading.local()
 
     @property
     def is_authenticated(self) -> bool:
@@ -48,6 +108,8 @@ class GmailService:
         if self._creds and self._creds.expired and self._creds.refresh_token:
             try:
                 self._creds.refresh(Request())
+                # Persist the new access token so the next run can reuse it
+                _save_token(self._creds)
             except Exception:
                 logger.warning("Token refresh failed, will re-authenticate")
                 self._creds = None
@@ -66,64 +128,191 @@ class GmailService:
             self._creds = flow.run_local_server(port=0)
 
             # Save token for next time
-            GOOGLE_TOKEN_PATH.write_text(self._creds.to_json())
+            _save_token(self._creds)
 
-        self._service = build("gmail", "v1", credentials=self._creds)
+        # One keep-alive transport for the service's lifetime; the bundled
+        # discovery document avoids a network fetch on every build
+        authed_http = google_auth_httplib2.AuthorizedHttp(self._creds, http=httplib2.Http(timeout=30))
+        self._service = build(
+            "gmail", "v1", http=authed_http, cache_discovery=False, static_discovery=True
+        )
         return True
 
     def _ensure_service(self):
         if self._service is None:
             self.authenticate()
 
+    def iter_messages(
+        self,
+        page_token: str | None = None,
+        max_pages: int | None = None,
+        fetch_mode: Literal["metadata", "full"] = "full",
+    ) -> Iterator[dict]:
+        """Yield every message matching the school query, following page tokens.
+
+        Transient API errors are retried with backoff on each list and batch call.
+        """
+        pages = 0
+        while max_pages is None or pages < max_pages:
+            messages, page_token = self.fetch_messages(page_token=page_token, fetch_mode=fetch_mode)
+            yield from messages
+            pages += 1
+            if not page_token:
+                return
+
     def fetch_messages(
-        self, page_token: str | None = None, max_results: int = GMAIL_MAX_RESULTS
+        self,
+        page_token: str | None = None,
+        max_results: int = GMAIL_MAX_RESULTS,
+        fetch_mode: Literal["metadata", "full"] = "full",
     ) -> tuple[list[dict], str | None]:
-        """Fetch messages matching the school query.
+        """Fetch one page of messages matching the school query.
+
+        Returns (messages, next_page_token). With fetch_mode="full" each message is
+        a full message resource dict; with "metadata" only labels, snippet and the
+        METADATA_HEADERS are included (use fetch_full for the ones worth keeping).
+        """
+        message_ids, next_token = self.list_message_ids(page_token=page_token, max_results=max_results)
 
-        Returns (messages, next_page_token). Each message is a full message resource dict.
+        if fetch_mode == "metadata":
+            messages = self._batch_get(message_ids, format="metadata", metadataHeaders=METADATA_HEADERS)
+        else:
+            messages = self.fetch_full(message_ids)
+        return messages, next_token
+
+    def list_message_ids(
+        self, page_token: str | None = None, max_results: int = GMAIL_MAX_RESULTS
+    ) -> tuple[list[str], str | None]:
+        """List one page of message IDs matching the school query.
+
+        Returns (message_ids, next_page_token); pass the IDs worth keeping to fetch_full.
         """
         self._ensure_service()
         query = build_gmail_query()
 
-        result = (
+        result = self._execute(
             self._service.users()
             .messages()
             .list(userId="me", q=query, maxResults=max_results, pageToken=page_token)
-            .execute()
         )
+        return [stub["id"] for stub in result.get("messages", [])], result.get("nextPageToken")
 
-        message_ids = result.get("messages", [])
-        next_token = result.get("nextPageToken")
+    def fetch_full(self, message_ids: list[str]) -> list[dict]:
+        """Fetch full message resources for the given IDs, in order."""
+        self._ensure_service()
+        return self._batch_get(message_ids, format="full")
 
-        messages = []
-        for msg_stub in message_ids:
-            msg = (
-                self._service.users()
-                .messages()
-                .get(userId="me", id=msg_stub["id"], format="full")
-                .execute()
-            )
-            messages.append(msg)
+    def _batch_get(self, message_ids: list[str], **get_kwargs) -> list[dict]:
+        """Fetch message resources via batch HTTP requests, in the order given.
 
-        return messages, next_token
+        Inner requests that fail with a retryable status are re-batched after a backoff.
+        """
+        results: dict[str, dict] = {}
+        errors: dict[str, Exception] = {}
+
+        def on_response(request_id, response, exception):
+            if exception is not None:
+                errors[request_id] = exception
+            else:
+                results[request_id] = response
+
+        messages_api = self._service.users().messages()
+        for start in range(0, len(message_ids), GMAIL_BATCH_SIZE):
+            pending = message_ids[start:start + GMAIL_BATCH_SIZE]
+            attempt = 1
+            while pending:
+                errors.clear()
+                batch = self._service.new_batch_http_request(callback=on_response)
+                for msg_id in pending:
+                    batch.add(messages_api.get(userId="me", id=msg_id, **get_kwargs), request_id=msg_id)
+                self._execute(batch)
+
+                wait = 0.0
+                for error in errors.values():
+                    delay = _retry_delay(error, attempt)
+                    if delay is None:
+                        raise error
+                    wait = max(wait, delay)
+                pending = list(errors)
+                if pending:
+                    logger.info(f"Retrying {len(pending)} Gmail message fetch(es) in {wait}s")
+                    time.sleep(wait)
+                    attempt += 1
+
+        return [results[msg_id] for msg_id in message_ids]
 
     def download_attachment(self, message_id: str, attachment_id: str, filename: str) -> Path:
         """Download an attachment and return the local file path."""
         self._ensure_service()
+        return self._download(message_id, attachment_id, filename)
+
+    def download_attachments(self, attachments: list[tuple[str, str, str]]) -> dict[str, Path]:
+        """Download several attachments in parallel.
 
-        att = (
+        Takes (message_id, attachment_id, filename) tuples and returns
+        {attachment_id: local_path} for the ones that succeeded.
+        """
+        self._ensure_service()
+        paths: dict[str, Path] = {}
+        if not attachments:
+            return paths
+
+        with ThreadPoolExecutor(max_workers=min(ATTACHMENT_WORKERS, len(attachments))) as pool:
+            futures = {
+                pool.submit(self._download_threaded, message_id, attachment_id, filename): attachment_id
+                for message_id, attachment_id, filename in attachments
+            }
+            for future in as_completed(futures):
+                attachment_id = futures[future]
+                try:
+                    paths[attachment_id] = future.result()
+                except Exception as e:
+                    logger.warning(f"Failed to download Gmail attachment {attachment_id}: {e}")
+        return paths
+
+    def _download_threaded(self, message_id: str, attachment_id: str, filename: str) -> Path:
+        return self._download(message_id, attachment_id, filename, http=self._thread_http())
+
+    def _download(self, message_id: str, attachment_id: str, filename: str, http=None) -> Path:
+        request = (
             self._service.users()
             .messages()
             .attachments()
             .get(userId="me", messageId=message_id, id=attachment_id)
-            .execute()
         )
+        data = self._execute(request, http=http)["data"]
 
-        data = base64.urlsafe_b64decode(att["data"])
+        # Gmail only serves attachments as base64 inside JSON (no media download),
+        # so decode and write in slices rather than holding a second full copy
         local_path = ATTACHMENTS_DIR / f"{message_id}_{filename}"
-        local_path.write_bytes(data)
+        with open(local_path, "wb") as fh:
+            for start in range(0, len(data), _B64_CHUNK):
+                fh.write(base64.urlsafe_b64decode(data[start:start + _B64_CHUNK]))
         return local_path
 
+    def _thread_http(self):
+        """Return this thread's authorized transport; httplib2.Http is not thread-safe."""
+        http = getattr(self._local, "http", None)
+        if http is None:
+            http = google_auth_httplib2.AuthorizedHttp(self._creds, http=httplib2.Http(timeout=30))
+            self._local.http = http
+        return http
+
+    @staticmethod
+    def _execute(request, http=None):
+        """Execute an API request, backing off on 429/500/503 responses."""
+        attempt = 1
+        while True:
+            try:
+                return request.execute(http=http)
+            except HttpError as e:
+                delay = _retry_delay(e, attempt)
+                if delay is None:
+                    raise
+                logger.info(f"Gmail returned {e.resp.status}, retrying in {delay}s")
+                time.sleep(delay)
+                attempt += 1
+
     @staticmethod
     def parse_message(msg: dict) -> dict:
         """Parse a Gmail API message resource into a flat dict.
@@ -131,7 +320,14 @@ class GmailService:
         Returns dict with keys: message_id, thread_id, timestamp, subject, sender,
         body_plain, body_html, label_ids, snippet, attachments.
         """
-        headers = {h["name"].lower(): h["value"] for h in msg["payload"].get("headers", [])}
+        # Only Subject and From are used; stop scanning once both are found
+        headers: dict[str, str] = {}
+        for h in msg["payload"].get("headers", ()):
+            name = h["name"].lower()
+            if name in _PARSED_HEADERS and name not in headers:
+                headers[name] = h["value"]
+                if len(headers) == len(_PARSED_HEADERS):
+                    break
 
         # Parse timestamp
         internal_date = int(msg.get("internalDate", 0))
@@ -159,25 +355,28 @@ class GmailService:
 
     @staticmethod
     def _extract_parts(payload: dict, body_parts: dict[str, list[str]], attachments: list[dict]):
-        """Recursively extract body text and attachment info from message payload."""
-        mime_type = payload.get("mimeType", "")
-        body = payload.get("body", {})
+        """Extract body text and attachment info from a message payload tree.
 
-        if mime_type == "text/plain" and body.get("data"):
-            body_parts["plain"].append(
-                base64.urlsafe_b64decode(body["data"]).decode("utf-8", errors="replace")
-            )
-        elif mime_type == "text/html" and body.get("data"):
-            body_parts["html"].append(
-                base64.urlsafe_b64decode(body["data"]).decode("utf-8", errors="replace")
-            )
-        elif body.get("attachmentId"):
-            attachments.append({
-                "attachment_id": body["attachmentId"],
-                "filename": payload.get("filename", "attachment"),
-                "mime_type": mime_type,
-                "size": body.get("size", 0),
-            })
-
-        for part in payload.get("parts", []):
-            GmailService._extract_parts(part, body_parts, attachments)
+        Walks the MIME tree depth-first with an explicit stack, in document order.
+        """
+        b64decode = base64.urlsafe_b64decode
+        stack = [payload]
+        while stack:
+            part = stack.pop()
+            mime_type = part.get("mimeType", "")
+            body = part.get("body", {})
+
+            kind = _TEXT_PART_KINDS.get(mime_type)
+            if kind and body.get("data"):
+                body_parts[kind].append(b64decode(body["data"]).decode("utf-8", errors="replace"))
+            elif body.get("attachmentId"):
+                attachments.append({
+                    "attachment_id": body["attachmentId"],
+                    "filename": part.get("filename", "attachment"),
+                    "mime_type": mime_type,
+                    "size": body.get("size", 0),
+                })
+
+            children = part.get("parts")
+            if children:
+                stack.extend(reversed(children))
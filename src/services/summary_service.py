@@ -1,10 +1,13 @@
 """Claude API integration for generating daily summaries from communications."""
 
+import hashlib
 import json
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from datetime import date, datetime, timedelta
 
 import anthropic
+import orjson
 
 from src.config.settings import CLAUDE_MODEL, SUMMARY_ROLLING_DAYS
 from sqlalchemy.orm import joinedload
@@ -16,6 +19,20 @@ from src.utils.html_utils import strip_html
 
 logger = logging.getLogger(__name__)
 
+# Days summarized concurrently; each is one independent Claude request
+SUMMARY_WORKERS = 4
+
+# Used to pull a JSON object out of a reply that has text around it
+_JSON_DECODER = json.JSONDecoder()
+
+# Characters kept from each body / attachment text in the prompt
+PROMPT_TEXT_LIMIT = 3000
+
+# Approximate token budget for all bodies / attachment texts in one day's
+# prompt, estimated at CHARS_PER_TOKEN characters per token
+PROMPT_TOKEN_BUDGET = 20_000
+CHARS_PER_TOKEN = 4
+
 SUMMARY_SYSTEM_PROMPT = """\
 You are a helpful assistant that analyzes school communications for a parent.
 You will be given a set of emails and activity feed items from a single day.
@@ -56,6 +73,37 @@ Rules:
 """
 
 
+def _truncate(text: str, limit: int = PROMPT_TEXT_LIMIT) -> str:
+    """Cap a body or attachment text to manage token usage."""
+    if len(text) > limit:
+        return f"{text[:limit]}\n[... truncated ...]"
+    return text
+
+
+def _text_limit(lengths: list[int], budget: int = PROMPT_TOKEN_BUDGET * CHARS_PER_TOKEN) -> int:
+    """Per-text character cap that fits all texts within the day's budget.
+
+    Short texts keep their full length and hand their unused share to the
+    longer ones; the result never exceeds PROMPT_TEXT_LIMIT.
+    """
+    remaining = budget
+    count = len(lengths)
+    for i, length in enumerate(sorted(lengths)):
+        share = remaining // (count - i)
+        if length > share:
+            return min(share, PROMPT_TEXT_LIMIT)
+        remaining -= length
+    return PROMPT_TEXT_LIMIT
+
+
+def _item_ids_digest(item_ids: list[int]) -> str:
+    """Fixed-size fingerprint of a day's sorted item IDs."""
+    h = hashlib.blake2b(digest_size=16)
+    for item_id in item_ids:
+        h.update(item_id.to_bytes(8, "little"))
+    return h.hexdigest()
+
+
 class SummaryService:
     """Generates daily summaries using Claude API."""
 
@@ -71,9 +119,20 @@ class SummaryService:
         session = get_session()
 
         try:
+            # DB reads/writes stay on this thread; only the Claude requests,
+            # which are independent per day, run concurrently
+            jobs = []
             for i in range(days):
                 target_date = today - timedelta(days=i)
-                self._generate_day_summary(session, target_date, force=force)
+                job = self._prepare_day_summary(session, target_date, force=force)
+                if job:
+                    jobs.append(job)
+
+            if jobs:
+                with ThreadPoolExecutor(max_workers=min(SUMMARY_WORKERS, len(jobs))) as pool:
+                    results = list(pool.map(lambda job: self._request_summary(job[0], job[2]), jobs))
+                for job, parsed in zip(jobs, results):
+                    self._store_day_summary(session, job, parsed)
             session.commit()
         except Exception:
             session.rollback()
@@ -89,39 +148,67 @@ class SummaryService:
 
     def _generate_day_summary(self, session, target_date: date, force: bool = False):
         """Generate or update summary for a single day."""
+        job = self._prepare_day_summary(session, target_date, force=force)
+        if job:
+            self._store_day_summary(session, job, self._request_summary(job[0], job[2]))
+
+    def _prepare_day_summary(
+        self, session, target_date: date, force: bool = False
+    ) -> tuple[str, DailySummary | None, str, str] | None:
+        """Decide whether a day needs a (re)generated summary.
+
+        Returns (date_str, existing_summary, prompt_content, source_hash), or
+        None when the day has no items or its summary is up to date.
+        """
         date_str = target_date.isoformat()
 
         # Get all items for this day
         day_start = datetime.combine(target_date, datetime.min.time())
         day_end = datetime.combine(target_date, datetime.max.time())
 
-        items = (
-            session.query(CommunicationItem)
-            .options(joinedload(CommunicationItem.attachments))
-            .filter(CommunicationItem.timestamp >= day_start)
-            .filter(CommunicationItem.timestamp <= day_end)
-            .order_by(CommunicationItem.timestamp)
-            .all()
-        )
+        # IDs only first: the common "nothing new" path never loads row bodies
+        current_item_ids = [
+            item_id for (item_id,) in (
+                session.query(CommunicationItem.id)
+                .filter(CommunicationItem.timestamp >= day_start)
+                .filter(CommunicationItem.timestamp <= day_end)
+                .order_by(CommunicationItem.id)
+            )
+        ]
 
-        if not items:
+        if not current_item_ids:
             return  # No communications this day
 
-        current_item_ids = sorted([item.id for item in items])
-        current_ids_json = json.dumps(current_item_ids)
-
         # Check if summary exists and is up to date
+        source_hash = _item_ids_digest(current_item_ids)
         existing = session.query(DailySummary).filter_by(date=date_str).first()
         if existing and not force:
-            if existing.source_item_ids == current_ids_json:
+            if existing.source_item_hash is None and existing.source_item_ids == current_item_ids:
+                # Summary predates the hash column; record it instead of regenerating
+                existing.source_item_hash = source_hash
+                existing.source_item_ids = None
+            if existing.source_item_hash == source_hash:
                 logger.debug(f"Summary for {date_str} is up to date, skipping")
                 return
 
+        items = (
+            session.query(CommunicationItem)
+            .options(joinedload(CommunicationItem.attachments))
+            .filter(CommunicationItem.id.in_(current_item_ids))
+            .order_by(CommunicationItem.timestamp)
+            .all()
+        )
+
         # Build prompt content from items
         prompt_content = self._build_prompt_content(items, target_date)
-
-        # Call Claude API
         logger.info(f"Generating summary for {date_str} ({len(items)} items)")
+        return date_str, existing, prompt_content, source_hash
+
+    def _request_summary(self, date_str: str, prompt_content: str) -> dict:
+        """Call Claude for one day's summary and parse the JSON reply.
+
+        Safe to call from worker threads: it touches no database state.
+        """
         response = self._client.messages.create(
             model=CLAUDE_MODEL,
             max_tokens=2048,
@@ -134,26 +221,32 @@ class SummaryService:
         if response_text.startswith("```"):
             response_text = response_text.split("\n", 1)[-1].rsplit("```", 1)[0].strip()
         try:
-            parsed = json.loads(response_text)
-        except json.JSONDecodeError:
-            # Try to extract JSON from response
-            import re
-            match = re.search(r'\{.*\}', response_text, re.DOTALL)
-            if match:
-                parsed = json.loads(match.group())
-            else:
-                logger.error(f"Failed to parse Claude response for {date_str}: {response_text[:200]}")
-                parsed = {
-                    "key_dates": [],
-                    "deadlines": [],
-                    "curriculum_updates": [],
-                    "action_items": [],
-                    "overview": {
-                        "nia_whyte_lovable_lambs": "",
-                        "zoe_whyte_hedgehogs": "",
-                        "general_bisc": response_text[:500],
-                    },
-                }
+            return orjson.loads(response_text)
+        except orjson.JSONDecodeError:
+            # Model wrapped the object in prose; decode from the first brace
+            start = response_text.find("{")
+            if start != -1:
+                try:
+                    parsed, _ = _JSON_DECODER.raw_decode(response_text, start)
+                    return parsed
+                except json.JSONDecodeError:
+                    pass
+            logger.error(f"Failed to parse Claude response for {date_str}: {response_text[:200]}")
+            return {
+                "key_dates": [],
+                "deadlines": [],
+                "curriculum_updates": [],
+                "action_items": [],
+                "overview": {
+                    "nia_whyte_lovable_lambs": "",
+                    "zoe_whyte_hedgehogs": "",
+                    "general_bisc": response_text[:500],
+                },
+            }
+
+    def _store_day_summary(self, session, job: tuple[str, DailySummary | None, str, str], parsed: dict):
+        """Insert or update the DailySummary row for a prepared day."""
+        date_str, existing, _, source_hash = job
 
         # Serialize the structured overview as JSON for storage in raw_summary
         overview = parsed.get("overview", {})
@@ -164,64 +257,73 @@ class SummaryService:
                 "zoe_whyte_hedgehogs": "",
                 "general_bisc": overview,
             }
-        raw_summary_json = json.dumps(overview)
+        raw_summary_json = orjson.dumps(overview).decode()
 
         # Store or update summary
         if existing:
-            existing.key_dates = json.dumps(parsed.get("key_dates", []))
-            existing.deadlines = json.dumps(parsed.get("deadlines", []))
-            existing.curriculum_updates = json.dumps(parsed.get("curriculum_updates", []))
-            existing.action_items = json.dumps(parsed.get("action_items", []))
+            existing.key_dates = parsed.get("key_dates", [])
+            existing.deadlines = parsed.get("deadlines", [])
+            existing.curriculum_updates = parsed.get("curriculum_updates", [])
+            existing.action_items = parsed.get("action_items", [])
             existing.raw_summary = raw_summary_json
-            existing.source_item_ids = current_ids_json
+            existing.source_item_ids = None
+            existing.source_item_hash = source_hash
             existing.generated_at = datetime.now()
         else:
             summary = DailySummary(
                 date=date_str,
-                key_dates=json.dumps(parsed.get("key_dates", [])),
-                deadlines=json.dumps(parsed.get("deadlines", [])),
-                curriculum_updates=json.dumps(parsed.get("curriculum_updates", [])),
-                action_items=json.dumps(parsed.get("action_items", [])),
+                key_dates=parsed.get("key_dates", []),
+                deadlines=parsed.get("deadlines", []),
+                curriculum_updates=parsed.get("curriculum_updates", []),
+                action_items=parsed.get("action_items", []),
                 raw_summary=raw_summary_json,
-                source_item_ids=current_ids_json,
+                source_item_hash=source_hash,
                 generated_at=datetime.now(),
             )
             session.add(summary)
 
     def _build_prompt_content(self, items: list[CommunicationItem], target_date: date) -> str:
         """Build the user prompt from communication items."""
-        parts = [f"Communications for {target_date.strftime('%A, %B %d, %Y')}:\n"]
-
-        for i, item in enumerate(items, 1):
-            parts.append(f"--- Item {i} ({item.source.upper()}) ---")
-            parts.append(f"Subject: {item.title}")
-            parts.append(f"From: {item.sender}")
-            parts.append(f"Time: {item.timestamp.strftime('%I:%M %p')}")
-
-            # Use plain text body, falling back to stripped HTML
-            body = item.body_plain
-            if not body and item.body_html:
-                body = strip_html(item.body_html)
+        # Use plain text body, falling back to stripped HTML
+        bodies = [
+            item.body_plain or (strip_html(item.body_html) if item.body_html else "")
+            for item in items
+        ]
+        # Share the day's token budget across every body and PDF text
+        lengths = [len(body) for body in bodies if body]
+        lengths.extend(
+            len(att.extracted_text)
+            for item in items
+            for att in item.attachments
+            if att.extracted_text
+        )
+        limit = _text_limit(lengths)
+
+        parts = [f"Communications for {target_date:%A, %B %d, %Y}:\n"]
+        append = parts.append
+
+        for i, (item, body) in enumerate(zip(items, bodies), 1):
+            append(
+                f"--- Item {i} ({item.source.upper()}) ---\n"
+                f"Subject: {item.title}\n"
+                f"From: {item.sender}\n"
+                f"Time: {item.timestamp:%I:%M %p}"
+            )
+
             if body:
-                # Truncate very long bodies to manage token usage
-                if len(body) > 3000:
-                    body = body[:3000] + "\n[... truncated ...]"
-                parts.append(f"Content:\n{body}")
+                append(f"Content:\n{_truncate(body, limit)}")
 
             # Include extracted text from PDF attachments
             for att in item.attachments:
                 if att.extracted_text:
-                    att_text = att.extracted_text
-                    if len(att_text) > 3000:
-                        att_text = att_text[:3000] + "\n[... truncated ...]"
-                    parts.append(f"[Attached PDF: {att.filename}]\n{att_text}")
+                    append(f"[Attached PDF: {att.filename}]\n{_truncate(att.extracted_text, limit)}")
 
             if item.bw_student_name:
-                parts.append(f"Student: {item.bw_student_name}")
+                append(f"Student: {item.bw_student_name}")
             if item.bw_action_type:
-                parts.append(f"Activity Type: {item.bw_action_type}")
+                append(f"Activity Type: {item.bw_action_type}")
 
-            parts.append("")
+            append("")
 
         return "\n".join(parts)
 
@@ -233,57 +335,60 @@ class SummaryService:
         today = date.today()
         session = get_session()
         try:
-            date_strings = [(today - timedelta(days=i)).isoformat() for i in range(days)]
+            # ISO dates sort lexically, so the window is one range scan over
+            # the unique (indexed) date column
+            first_day = (today - timedelta(days=days - 1)).isoformat()
             summaries = (
                 session.query(DailySummary)
-                .filter(DailySummary.date.in_(date_strings))
+                .filter(DailySummary.date.between(first_day, today.isoformat()))
                 .all()
             )
             # Detach from session so they can be used after close
-            result = {}
-            for s in summaries:
-                session.expunge(s)
-                result[s.date] = s
-            return result
+            session.expunge_all()
+            return {s.date: s for s in summaries}
         finally:
             session.close()
 
-    def get_aggregated_summary(self, days: int = SUMMARY_ROLLING_DAYS) -> dict[str, list[str]]:
+    def get_aggregated_summary(
+        self, days: int = SUMMARY_ROLLING_DAYS, summaries: dict[str, DailySummary] | None = None
+    ) -> dict[str, list[str]]:
         """Get aggregated summary items across the rolling window.
 
+        Pass ``summaries`` from get_rolling_summaries to reuse an already loaded window.
         Returns dict with keys: key_dates, deadlines, curriculum_updates, action_items.
         Each value is a deduplicated list of strings.
         """
-        summaries = self.get_rolling_summaries(days)
-
-        aggregated: dict[str, list[str]] = {
-            "key_dates": [],
-            "deadlines": [],
-            "curriculum_updates": [],
-            "action_items": [],
+        if summaries is None:
+            summaries = self.get_rolling_summaries(days)
+
+        # normalized text -> first original spelling, per category (insertion ordered)
+        unique: dict[str, dict[str, str]] = {
+            "key_dates": {},
+            "deadlines": {},
+            "curriculum_updates": {},
+            "action_items": {},
         }
 
-        seen: dict[str, set[str]] = {k: set() for k in aggregated}
-
+        strip, lower = str.strip, str.lower
         for date_str in sorted(summaries.keys(), reverse=True):
             s = summaries[date_str]
-            for category in aggregated:
-                items = getattr(s, f"{category}_list", [])
-                for item in items:
-                    normalized = item.strip().lower()
-                    if normalized not in seen[category]:
-                        seen[category].add(normalized)
-                        aggregated[category].append(item)
+            for category, seen in unique.items():
+                for item in getattr(s, f"{category}_list", []):
+                    seen.setdefault(lower(strip(item)), item)
 
-        return aggregated
+        return {category: list(seen.values()) for category, seen in unique.items()}
 
-    def get_rolling_raw_summaries(self, days: int = SUMMARY_ROLLING_DAYS) -> dict[str, list[str]]:
+    def get_rolling_raw_summaries(
+        self, days: int = SUMMARY_ROLLING_DAYS, summaries: dict[str, DailySummary] | None = None
+    ) -> dict[str, list[str]]:
         """Aggregate structured overview summaries across the rolling window.
 
+        Pass ``summaries`` from get_rolling_summaries to reuse an already loaded window.
         Returns a dict with keys: nia_whyte_lovable_lambs, zoe_whyte_hedgehogs, general_bisc.
         Each value is a list of "date: summary" strings.
         """
-        summaries = self.get_rolling_summaries(days)
+        if summaries is None:
+            summaries = self.get_rolling_summaries(days)
         result: dict[str, list[str]] = {
             "nia_whyte_lovable_lambs": [],
             "zoe_whyte_hedgehogs": [],
@@ -292,16 +397,7 @@ class SummaryService:
 
         for date_str in sorted(summaries.keys(), reverse=True):
             s = summaries[date_str]
-            if not s.raw_summary:
-                continue
-
-            # Try to parse as structured JSON; fall back to legacy plain text
-            try:
-                overview = json.loads(s.raw_summary)
-            except (json.JSONDecodeError, TypeError):
-                # Legacy format: plain text string — put into general_bisc
-                overview = {"general_bisc": s.raw_summary}
-
+            overview = s.overview_dict
             for key in result:
                 text = overview.get(key, "")
                 if text and text.strip():
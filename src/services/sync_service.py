@@ -1,11 +1,19 @@
 """Orchestrates fetching from Gmail, Brightwheel, and WhatsApp, mapping to CommunicationItem."""
 
+import hashlib
 import json
 import logging
+import multiprocessing
 import os
-from datetime import datetime
-from urllib.parse import unquote, urlparse
-
+import re
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from datetime import datetime, timedelta
+from pathlib import Path
+from urllib.parse import unquote
+
+import orjson
+from sqlalchemy import select, update
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from sqlalchemy.exc import IntegrityError
 
 from src.config.settings import ATTACHMENTS_DIR
@@ -13,10 +21,11 @@ from src.models.base import get_session
 from src.models.communication import Attachment, CommunicationItem, SyncState
 from src.services.gmail_service import GmailService
 from src.services.brightwheel_auth import BrightwheelAuth
-from src.services.brightwheel_service import BrightwheelService
+from src.services.brightwheel_service import BrightwheelService, new_http_session
 from src.services.whatsapp_service import WhatsAppService
 from src.services.credential_manager import get_wa_groups
 from src.utils.date_utils import parse_timestamp
+from src.utils.pdf_utils import extract_pdf_text
 
 logger = logging.getLogger(__name__)
 
@@ -34,12 +43,139 @@ _EXT_MIME_MAP = {
 
 PDF_MAX_SIZE = 10 * 1024 * 1024  # 10 MB
 
+# Path separators in attachment filenames become underscores on disk
+_FN_SAFE = str.maketrans({"/": "_", "\\": "_"})
+
+# Last path segment of a URL (RFC 3986 scheme/authority/path/query/fragment;
+# a trailing ";params" is dropped as urlparse does)
+_URL_TAIL_RE = re.compile(r"^(?:[^:/?#]+:)?(?://[^/?#]*)?[^?#]*?([^/?#;]*)(?:;[^/?#]*)?(?:[?#]|$)")
+
+# User fields that may hold the guardian ID, in order of preference
+_GUARDIAN_ID_KEYS = ("guardian_id", "id", "object_id", "guardian_object_id")
+
+# How long the Brightwheel guardian ID and student list are reused between syncs
+BW_PROFILE_TTL = timedelta(hours=24)
+
+# Concurrent PDF downloads in _download_and_extract_pdfs (within the shared
+# HTTP session's pool)
+PDF_DOWNLOAD_WORKERS = 8
+# Worker processes for pdfplumber text extraction
+PDF_EXTRACT_WORKERS = min(4, os.cpu_count() or 1)
+
+
+def _url_tail(url: str) -> tuple[str, str]:
+    """(last path segment, lower-cased extension) of a URL, still percent-encoded."""
+    tail = _URL_TAIL_RE.match(url).group(1)
+    return tail, os.path.splitext(tail)[1].lower()
+
+
+def _existing_source_ids(session, source_ids: list[str]) -> set[str]:
+    """Return the subset of source_ids already stored, in one query."""
+    if not source_ids:
+        return set()
+    return set(
+        session.scalars(
+            select(CommunicationItem.source_id).where(CommunicationItem.source_id.in_(source_ids))
+        )
+    )
+
+
+def _download_pdf(http_session, url: str, local_name: str, filename: str) -> Path | None:
+    """Download a PDF into ATTACHMENTS_DIR with a size guard.
+
+    Returns the saved path, or None if the file is over PDF_MAX_SIZE.
+    Touches no database state, so it is safe to run in worker threads.
+    """
+    # The shared session defaults to Accept: application/json for the API.
+    # stream=True returns after the headers, so an oversized file is rejected
+    # from Content-Length before any of its body is read; closing the response
+    # then drops the connection instead of draining it.
+    with http_session.get(url, stream=True, timeout=30, headers={"Accept": "*/*"}) as resp:
+        resp.raise_for_status()
+
+        content_length = int(resp.headers.get("content-length", 0))
+        if content_length > PDF_MAX_SIZE:
+            logger.warning(f"PDF too large ({content_length} bytes), skipping: {filename}")
+            return None
+
+        # Stream to disk with a size guard
+        local_path = ATTACHMENTS_DIR / local_name.translate(_FN_SAFE)
+        total_bytes = 0
+        with open(local_path, "wb") as f:
+            for chunk in resp.iter_content(chunk_size=64 * 1024):
+                total_bytes += len(chunk)
+                if total_bytes > PDF_MAX_SIZE:
+                    break
+                f.write(chunk)
+    if total_bytes > PDF_MAX_SIZE:
+        local_path.unlink(missing_ok=True)
+        logger.warning(f"PDF exceeded size limit during download, skipping: {filename}")
+        return None
+    return local_path
+
+
+def _dump_preview(obj, limit: int = 2000) -> str:
+    """Indented JSON of obj, cut at `limit` chars without encoding the rest."""
+    parts = []
+    size = 0
+    for chunk in json.JSONEncoder(indent=2, default=str).iterencode(obj):
+        parts.append(chunk)
+        size += len(chunk)
+        if size >= limit:
+            break
+    return "".join(parts)[:limit]
+
+
+def _resolve_guardian_id(user_data: dict) -> str | None:
+    """Find the guardian ID in a /users/me payload, whose shape varies by account.
+
+    Tries direct fields on the user, then a guardian/parent role, then the
+    first entry of a guardians list.
+    """
+    user = user_data.get("user", user_data)
+    for key in _GUARDIAN_ID_KEYS:
+        val = user.get(key)
+        if val:
+            return str(val)
+    for role in user.get("roles", ()):
+        if isinstance(role, dict) and role.get("type") in ("guardian", "parent"):
+            guardian_id = str(role.get("id", role.get("object_id", "")))
+            if guardian_id:
+                return guardian_id
+    guardians = user.get("guardians", user_data.get("guardians", []))
+    if guardians and isinstance(guardians, list):
+        return str(guardians[0].get("id", guardians[0].get("object_id", "")))
+    return None
+
+
+def _auth_key(auth: BrightwheelAuth) -> str:
+    """Short fingerprint of the Brightwheel login, for keying cached profile data."""
+    session_cookie = auth.get_cookies_dict().get("_brightwheel_v2", "")
+    return hashlib.blake2b(session_cookie.encode(), digest_size=8).hexdigest()
+
+
+def _load_bw_profile(state: SyncState, auth_key: str) -> tuple[str, list[dict]] | None:
+    """Cached (guardian_id, student_entries) from SyncState.extra, if fresh for this login."""
+    if not state.extra:
+        return None
+    try:
+        cached = orjson.loads(state.extra)
+        fetched_at = datetime.fromisoformat(cached["fetched_at"])
+        if cached["auth_key"] != auth_key or datetime.now() - fetched_at > BW_PROFILE_TTL:
+            return None
+        return cached["guardian_id"], cached["students"]
+    except (orjson.JSONDecodeError, KeyError, TypeError, ValueError):
+        return None
+
 
 class SyncService:
     """Fetches data from sources and stores as CommunicationItems."""
 
     def __init__(self, progress_callback=None):
         self._progress = progress_callback or (lambda msg: None)
+        # Shared by the Brightwheel API client and PDF downloads, so same-host
+        # requests reuse pooled connections for the whole sync
+        self._http = new_http_session()
 
     def sync_gmail(self):
         """Fetch Gmail messages and store them."""
@@ -59,47 +195,46 @@ class SyncService:
 
             while pages_fetched < max_pages:
                 self._progress(f"Fetching Gmail page {pages_fetched + 1}...")
-                messages, next_token = gmail.fetch_messages(page_token=page_token)
+                message_ids, next_token = gmail.list_message_ids(page_token=page_token)
 
-                if not messages:
+                if not message_ids:
                     break
 
-                for msg in messages:
-                    parsed = GmailService.parse_message(msg)
-                    source_id = f"gmail_{parsed['message_id']}"
-
-                    # Skip duplicates
-                    existing = session.query(CommunicationItem).filter_by(source_id=source_id).first()
-                    if existing:
-                        continue
-
-                    item = CommunicationItem(
+                # Skip stored messages before downloading any bodies; the rest
+                # arrive in batched requests
+                existing = _existing_source_ids(session, [f"gmail_{mid}" for mid in message_ids])
+                new_ids = [
+                    mid for mid in dict.fromkeys(message_ids) if f"gmail_{mid}" not in existing
+                ]
+                parsed_messages = [GmailService.parse_message(msg) for msg in gmail.fetch_full(new_ids)]
+
+                new_items = []
+                for parsed in parsed_messages:
+                    new_items.append(CommunicationItem(
                         timestamp=parsed["timestamp"],
                         title=parsed["subject"],
                         sender=parsed["sender"],
                         body_plain=parsed["body_plain"],
                         body_html=parsed["body_html"],
                         source="gmail",
-                        source_id=source_id,
+                        source_id=f"gmail_{parsed['message_id']}",
                         gmail_thread_id=parsed["thread_id"],
-                        gmail_label_ids=json.dumps(parsed["label_ids"]),
+                        gmail_label_ids=parsed["label_ids"],
                         gmail_snippet=parsed["snippet"],
-                    )
-                    session.add(item)
-                    session.flush()
-
-                    # Add attachments
-                    for att_info in parsed["attachments"]:
-                        att = Attachment(
-                            communication_id=item.id,
-                            filename=att_info["filename"],
-                            mime_type=att_info["mime_type"],
-                            remote_url=att_info.get("attachment_id", ""),
-                            is_downloaded=False,
-                        )
-                        session.add(att)
-
-                    total_new += 1
+                        attachments=[
+                            Attachment(
+                                filename=att_info["filename"],
+                                mime_type=att_info["mime_type"],
+                                remote_url=att_info.get("attachment_id", ""),
+                                is_downloaded=False,
+                            )
+                            for att_info in parsed["attachments"]
+                        ],
+                    ))
+
+                # Added together so the next flush batches the page's INSERTs
+                session.add_all(new_items)
+                total_new += len(new_items)
 
                 pages_fetched += 1
                 page_token = next_token
@@ -134,64 +269,40 @@ class SyncService:
                 "No Brightwheel session found. Use Accounts > Setup Brightwheel to login first."
             )
 
-        bw = BrightwheelService(auth)
+        bw = BrightwheelService(auth, session=self._http)
 
-        # Get user info
-        self._progress("Fetching Brightwheel user info...")
-        user_data = bw.get_current_user()
-
-        # Find guardian ID - search through various possible response structures
-        logger.info(f"Brightwheel user data keys: {list(user_data.keys())}")
-        logger.info(f"Brightwheel user data: {json.dumps(user_data, indent=2, default=str)[:2000]}")
-
-        guardian_id = None
-        user = user_data.get("user", user_data)
-
-        # Try direct fields
-        for key in ("guardian_id", "id", "object_id", "guardian_object_id"):
-            val = user.get(key)
-            if val:
-                guardian_id = str(val)
-                logger.info(f"Found guardian_id via user['{key}']: {guardian_id}")
-                break
-
-        # Try nested in roles
-        if not guardian_id:
-            for role in user.get("roles", []):
-                if isinstance(role, dict) and role.get("type") in ("guardian", "parent"):
-                    guardian_id = str(role.get("id", role.get("object_id", "")))
-                    if guardian_id:
-                        logger.info(f"Found guardian_id via roles: {guardian_id}")
-                        break
-
-        # Try guardians list
-        if not guardian_id:
-            guardians = user.get("guardians", user_data.get("guardians", []))
-            if guardians and isinstance(guardians, list):
-                guardian_id = str(guardians[0].get("id", guardians[0].get("object_id", "")))
-                logger.info(f"Found guardian_id via guardians list: {guardian_id}")
-
-        if not guardian_id:
-            raise RuntimeError(
-                f"Could not determine guardian ID from Brightwheel user data. "
-                f"Response keys: {list(user_data.keys())}. "
-                f"User keys: {list(user.keys()) if isinstance(user, dict) else 'N/A'}. "
-                f"Please check the logs or try the manual cookie fallback."
-            )
-
-        # Get students - each entry has a nested "student" key
-        self._progress("Fetching student list...")
-        student_entries = bw.get_students(guardian_id)
-        self._progress(f"Found {len(student_entries)} students")
+        # One "as of" time for the whole sync: the next sync's cutoff, and the
+        # timestamp for items whose own timestamp can't be parsed
+        sync_started_at = datetime.now()
 
         session = get_session()
         try:
             # Get sync state for cutoff date
             state = session.query(SyncState).filter_by(source="brightwheel").first()
             since = state.last_sync_at if state else None
+            if not state:
+                state = SyncState(source="brightwheel")
+                session.add(state)
+
+            # Guardian and student list rarely change; reuse them for a day
+            # per login instead of fetching both on every sync
+            auth_key = _auth_key(auth)
+            cached = _load_bw_profile(state, auth_key)
+            if cached:
+                guardian_id, student_entries = cached
+                self._progress(f"Found {len(student_entries)} students")
+            else:
+                guardian_id, student_entries = self._fetch_bw_profile(bw)
+                state.extra = orjson.dumps({
+                    "auth_key": auth_key,
+                    "guardian_id": guardian_id,
+                    "students": student_entries,
+                    "fetched_at": datetime.now().isoformat(),
+                }).decode()
 
             total_new = 0
 
+            students = []
             for entry in student_entries:
                 # Student info is nested under "student" key
                 student = entry.get("student", entry)
@@ -201,30 +312,39 @@ class SyncService:
                 if not student_id:
                     logger.warning(f"Skipping student with no ID: {entry}")
                     continue
+                students.append((student_id, student_name))
 
-                # Fetch activities
-                self._progress(f"Fetching activities for {student_name}...")
-                activities = bw.fetch_all_activities(student_id, since=since)
-                self._progress(f"Got {len(activities)} activities for {student_name}")
+            # Every student's activity and message feeds are fetched concurrently
+            self._progress(f"Fetching activities and messages for {len(students)} student(s)...")
+            feeds = bw.fetch_all_feeds([student_id for student_id, _ in students], since=since)
 
-                for activity in activities:
-                    parsed = BrightwheelService.parse_activity(activity, student_name=student_name)
-                    total_new += self._store_bw_item(session, parsed)
+            for student_id, student_name in students:
+                activities, messages = feeds[student_id]
+                self._progress(
+                    f"Got {len(activities)} activities and {len(messages)} messages for {student_name}"
+                )
 
-                # Fetch messages
-                self._progress(f"Fetching messages for {student_name}...")
-                messages = bw.fetch_all_messages(student_id, since=since)
-                self._progress(f"Got {len(messages)} messages for {student_name}")
+                parsed_items = [
+                    BrightwheelService.parse_activity(activity, student_name=student_name)
+                    for activity in activities
+                ]
+                parsed_items.extend(
+                    BrightwheelService.parse_message(msg_result, student_name=student_name)
+                    for msg_result in messages
+                )
 
-                for msg_result in messages:
-                    parsed = BrightwheelService.parse_message(msg_result, student_name=student_name)
-                    total_new += self._store_bw_item(session, parsed)
+                existing = _existing_source_ids(
+                    session, [parsed.get("source_id", "") for parsed in parsed_items]
+                )
+                new_items = [
+                    item for item in (self._prepare_bw_item(parsed, existing, sync_started_at) for parsed in parsed_items)
+                    if item is not None
+                ]
+                session.add_all(new_items)
+                total_new += len(new_items)
 
             # Update sync state
-            if not state:
-                state = SyncState(source="brightwheel")
-                session.add(state)
-            state.last_sync_at = datetime.now()
+            state.last_sync_at = sync_started_at
 
             session.commit()
             self._progress(f"Brightwheel sync complete: {total_new} new items")
@@ -242,23 +362,47 @@ class SyncService:
         except Exception:
             logger.warning("PDF download/extraction failed", exc_info=True)
 
+    def _fetch_bw_profile(self, bw: BrightwheelService) -> tuple[str, list[dict]]:
+        """Fetch the guardian ID and student entries for the logged-in user."""
+        # Get user info
+        self._progress("Fetching Brightwheel user info...")
+        user_data = bw.get_current_user()
+
+        logger.info(f"Brightwheel user data keys: {list(user_data.keys())}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"Brightwheel user data: {_dump_preview(user_data)}")
+
+        guardian_id = _resolve_guardian_id(user_data)
+        if not guardian_id:
+            user = user_data.get("user", user_data)
+            raise RuntimeError(
+                f"Could not determine guardian ID from Brightwheel user data. "
+                f"Response keys: {list(user_data.keys())}. "
+                f"User keys: {list(user.keys()) if isinstance(user, dict) else 'N/A'}. "
+                f"Please check the logs or try the manual cookie fallback."
+            )
+        logger.info(f"Found guardian_id: {guardian_id}")
+
+        # Get students - each entry has a nested "student" key
+        self._progress("Fetching student list...")
+        student_entries = bw.get_students(guardian_id)
+        self._progress(f"Found {len(student_entries)} students")
+        return guardian_id, student_entries
+
     def _download_and_extract_pdfs(self, auth: BrightwheelAuth):
         """Download PDF attachments from Brightwheel and extract text with pdfplumber."""
-        import pdfplumber
-        import requests
-
         session = get_session()
         try:
-            pending_pdfs = (
-                session.query(Attachment)
+            # Only the columns needed to download; rows are updated by id below
+            pending_pdfs = session.execute(
+                select(Attachment.id, Attachment.communication_id, Attachment.filename, Attachment.remote_url)
                 .join(CommunicationItem)
-                .filter(
+                .where(
                     CommunicationItem.source == "brightwheel",
                     Attachment.mime_type == "application/pdf",
                     Attachment.is_downloaded == False,  # noqa: E712
                 )
-                .all()
-            )
+            ).all()
 
             if not pending_pdfs:
                 return
@@ -266,65 +410,76 @@ class SyncService:
             self._progress(f"Downloading {len(pending_pdfs)} PDF attachment(s)...")
             logger.info(f"Downloading {len(pending_pdfs)} PDF attachment(s)")
 
-            http_session = requests.Session()
-            http_session.cookies.update(auth.get_cookies_dict())
+            auth.apply_to_session(self._http)
 
             ATTACHMENTS_DIR.mkdir(parents=True, exist_ok=True)
 
-            for att in pending_pdfs:
-                try:
-                    if not att.remote_url:
-                        continue
-
-                    # Download with size limit
-                    resp = http_session.get(att.remote_url, stream=True, timeout=30)
-                    resp.raise_for_status()
-
-                    content_length = int(resp.headers.get("content-length", 0))
-                    if content_length > PDF_MAX_SIZE:
-                        logger.warning(f"PDF too large ({content_length} bytes), skipping: {att.filename}")
+            # Each distinct URL is downloaded once and shared by every
+            # attachment row that points at it
+            by_url: dict[str, list[tuple[int, int, str]]] = {}
+            for att_id, communication_id, filename, remote_url in pending_pdfs:
+                if remote_url:
+                    by_url.setdefault(remote_url, []).append((att_id, communication_id, filename))
+
+            # Downloads run in worker threads and text extraction (CPU-bound)
+            # in worker processes; the database stays on this thread. The
+            # process pool is only started once a download has succeeded.
+            extractors = None
+            try:
+                with ThreadPoolExecutor(max_workers=PDF_DOWNLOAD_WORKERS) as pool:
+                    downloads = {}
+                    for url, rows in by_url.items():
+                        att_id, communication_id, filename = rows[0]
+                        future = pool.submit(
+                            _download_pdf, self._http, url, f"{communication_id}_{att_id}_{filename}", filename
+                        )
+                        downloads[future] = url
+
+                    extractions = {}
+                    for future in as_completed(downloads):
+                        rows = by_url[downloads[future]]
+                        try:
+                            local_path = future.result()
+                        except Exception:
+                            logger.warning(f"Failed to download PDF: {rows[0][2]}", exc_info=True)
+                            continue
+                        if local_path is None:
+                            continue
+                        if extractors is None:
+                            # Spawn, not fork: this process has Qt, Playwright and
+                            # the download threads running, and forking a threaded
+                            # process can deadlock the child
+                            extractors = ProcessPoolExecutor(
+                                max_workers=PDF_EXTRACT_WORKERS,
+                                mp_context=multiprocessing.get_context("spawn"),
+                            )
+                        extractions[extractors.submit(extract_pdf_text, str(local_path))] = (rows, local_path)
+
+                for future in as_completed(extractions):
+                    rows, local_path = extractions[future]
+                    try:
+                        extracted_text = future.result()
+                    except Exception:
+                        logger.warning(f"Failed to extract PDF: {rows[0][2]}", exc_info=True)
                         continue
 
-                    # Read content with size guard
-                    chunks = []
-                    total_bytes = 0
-                    for chunk in resp.iter_content(chunk_size=8192):
-                        total_bytes += len(chunk)
-                        if total_bytes > PDF_MAX_SIZE:
-                            logger.warning(f"PDF exceeded size limit during download, skipping: {att.filename}")
-                            break
-                        chunks.append(chunk)
-                    else:
-                        # Only process if download completed (no break)
-                        pdf_data = b"".join(chunks)
-
-                        # Save to disk
-                        safe_filename = att.filename.replace("/", "_").replace("\\", "_")
-                        local_filename = f"{att.communication_id}_{att.id}_{safe_filename}"
-                        local_path = ATTACHMENTS_DIR / local_filename
-                        local_path.write_bytes(pdf_data)
-
-                        # Extract text
-                        extracted_pages = []
-                        with pdfplumber.open(local_path) as pdf:
-                            for page in pdf.pages:
-                                page_text = page.extract_text()
-                                if page_text:
-                                    extracted_pages.append(page_text)
-
-                        extracted_text = "\n\n".join(extracted_pages) if extracted_pages else ""
-
-                        # Update record
-                        att.local_path = str(local_path)
-                        att.is_downloaded = True
-                        att.extracted_text = extracted_text if extracted_text else None
-
-                        logger.info(
-                            f"Extracted {len(extracted_text)} chars from PDF: {att.filename}"
+                    # Update records
+                    session.execute(
+                        update(Attachment)
+                        .where(Attachment.id.in_([att_id for att_id, _, _ in rows]))
+                        .values(
+                            local_path=str(local_path),
+                            is_downloaded=True,
+                            extracted_text=extracted_text if extracted_text else None,
                         )
+                    )
 
-                except Exception:
-                    logger.warning(f"Failed to download/extract PDF: {att.filename}", exc_info=True)
+                    logger.info(
+                        f"Extracted {len(extracted_text)} chars from PDF: {rows[0][2]}"
+                    )
+            finally:
+                if extractors is not None:
+                    extractors.shutdown()
 
             session.commit()
 
@@ -334,20 +489,26 @@ class SyncService:
         finally:
             session.close()
 
-    def _store_bw_item(self, session, parsed: dict) -> int:
-        """Store a parsed Brightwheel item. Returns 1 if new, 0 if duplicate."""
+    def _prepare_bw_item(
+        self, parsed: dict, existing: set[str], fallback_ts: datetime
+    ) -> CommunicationItem | None:
+        """Build a CommunicationItem for a parsed Brightwheel item, or None if duplicate.
+
+        `existing` holds source_ids already stored and gains the new item's id.
+        `fallback_ts` is used when the item's timestamp can't be parsed.
+        """
         source_id = parsed.get("source_id", "")
         if not source_id or source_id in ("bw_act_", "bw_msg_"):
-            return 0
+            return None
 
-        existing = session.query(CommunicationItem).filter_by(source_id=source_id).first()
-        if existing:
-            return 0
+        if source_id in existing:
+            return None
+        existing.add(source_id)
 
         try:
             ts = parse_timestamp(parsed["timestamp"])
         except (ValueError, TypeError):
-            ts = datetime.now()
+            ts = fallback_ts
 
         item = CommunicationItem(
             timestamp=ts,
@@ -361,43 +522,44 @@ class SyncService:
             bw_action_type=parsed["action_type"],
             bw_details=parsed["details"],
         )
-        session.add(item)
-        session.flush()
 
         # Use structured attachment_list if available, fall back to photos list
         attachment_list = parsed.get("attachment_list", [])
+        # The same media can be listed more than once on an item; keep one row per URL
+        seen_urls: set[str] = set()
         if attachment_list:
             for att_info in attachment_list:
                 url = att_info["url"]
+                if url in seen_urls:
+                    continue
+                seen_urls.add(url)
                 filename = att_info.get("filename", "attachment")
                 # Determine mime type: use API content_type, then URL extension, then default
                 mime_type = att_info.get("content_type", "")
                 if not mime_type:
-                    ext = os.path.splitext(urlparse(url).path)[1].lower()
-                    mime_type = _EXT_MIME_MAP.get(ext, "image/jpeg")
-                att = Attachment(
-                    communication_id=item.id,
+                    mime_type = _EXT_MIME_MAP.get(_url_tail(url)[1], "image/jpeg")
+                item.attachments.append(Attachment(
                     filename=filename,
                     mime_type=mime_type,
                     remote_url=url,
                     is_downloaded=False,
-                )
-                session.add(att)
+                ))
         else:
             # Backward compat: fall back to plain photos list
             for photo_url in parsed.get("photos", []):
-                ext = os.path.splitext(urlparse(photo_url).path)[1].lower()
+                if photo_url in seen_urls:
+                    continue
+                seen_urls.add(photo_url)
+                tail, ext = _url_tail(photo_url)
                 mime_type = _EXT_MIME_MAP.get(ext, "image/jpeg")
-                att = Attachment(
-                    communication_id=item.id,
-                    filename=unquote(urlparse(photo_url).path.rsplit("/", 1)[-1]) or "photo.jpg",
+                item.attachments.append(Attachment(
+                    filename=unquote(tail) or "photo.jpg",
                     mime_type=mime_type,
                     remote_url=photo_url,
                     is_downloaded=False,
-                )
-                session.add(att)
+                ))
 
-        return 1
+        return item
 
     def sync_whatsapp(self):
         """Fetch WhatsApp group messages and store them."""
@@ -419,31 +581,32 @@ class SyncService:
 
             total_new = 0
 
-            for group_name in groups:
-                self._progress(f"Scraping WhatsApp group: {group_name}...")
-                messages = svc.scrape_group(group_name, since=since)
-                self._progress(f"Got {len(messages)} messages from {group_name}")
-
-                for msg in messages:
-                    source_id = msg["source_id"]
+            # One browser for every group instead of a relaunch per group
+            with svc:
+                for group_name in groups:
+                    self._progress(f"Scraping WhatsApp group: {group_name}...")
+                    messages = svc.scrape_group(group_name, since=since)
+                    self._progress(f"Got {len(messages)} messages from {group_name}")
 
-                    existing = session.query(CommunicationItem).filter_by(
-                        source_id=source_id
-                    ).first()
-                    if existing:
+                    if not messages:
                         continue
 
-                    item = CommunicationItem(
-                        timestamp=msg["timestamp"],
-                        title=msg["title"],
-                        sender=msg["sender"],
-                        body_plain=msg["body_plain"],
-                        source="whatsapp",
-                        source_id=source_id,
+                    # The unique source_id index does the dedupe; one statement per group
+                    result = session.execute(
+                        sqlite_insert(CommunicationItem.__table__).on_conflict_do_nothing(index_elements=["source_id"]),
+                        [
+                            {
+                                "timestamp": msg["timestamp"],
+                                "title": msg["title"],
+                                "sender": msg["sender"],
+                                "body_plain": msg["body_plain"],
+                                "source": "whatsapp",
+                                "source_id": msg["source_id"],
+                            }
+                            for msg in messages
+                        ],
                     )
-                    session.add(item)
-                    session.flush()
-                    total_new += 1
+                    total_new += result.rowcount
 
             # Update sync state
             if not state:
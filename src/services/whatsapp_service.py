@@ -21,6 +21,10 @@ logger = logging.getLogger(__name__)
 # WhatsApp Web URL
 WA_URL = "https://web.whatsapp.com"
 
+# Chromium creates this once WhatsApp Web has stored session data in the
+# profile, so its presence stands in for a saved session
+WA_SESSION_SENTINEL = WA_PROFILE_DIR / "Default" / "IndexedDB"
+
 # --- DOM Selectors ---
 # WhatsApp Web uses data-testid attributes. These may change when WhatsApp
 # updates their UI — keep them here as constants for easy maintenance.
@@ -37,6 +41,104 @@ SEL_SIDE_PANEL_FALLBACK = '#pane-side'
 SEL_SEARCH_INPUT_FALLBACK = 'div[role="textbox"][data-tab="3"]'
 SEL_CONVERSATION_PANEL_FALLBACK = '#main div[role="application"]'
 
+# Message rows in the open chat (ARIA role, stable across UI versions)
+SEL_ROW = 'div[role="row"]'
+
+# Message body selectors, tried in priority order within each row
+SEL_MSG_TEXT_CANDIDATES = [
+    SEL_MSG_TEXT,                    # data-testid="msg-text"
+    'span.selectable-text',          # class-based
+    'span[dir="ltr"]',               # text direction attribute
+    'div.copyable-text span',        # copyable text container
+]
+
+# data-pre-plain-text looks like "[10:30 AM, 1/15/2025] Sender: "
+_PRE_PLAIN_RE = re.compile(r'\[(.+?),\s*(.+?)\]')
+_SENDER_RE = re.compile(r'\]\s*(.+?):\s*$')
+
+# --- Browser-side wait conditions (used with page.wait_for_function) ---
+# True once the element (or something inside it) holds keyboard focus
+JS_HAS_FOCUS = "el => el === document.activeElement || el.contains(document.activeElement)"
+
+# Tag name and contenteditable state of the search input, in one round trip
+JS_INPUT_INFO = "el => ({tag: el.tagName, editable: el.isContentEditable})"
+
+# Best search result for a group name, in the same priority order the
+# matching has always used; null when nothing matches
+JS_FIND_GROUP = """([titleSel, name]) => {
+    const titled = [...document.querySelectorAll(titleSel)].map(el => [el, (el.innerText || '').trim().toLowerCase()]);
+    const spans = [...document.querySelectorAll('span[title]')].map(el => [el, (el.getAttribute('title') || '').toLowerCase()]);
+    for (const [candidates, exact] of [[titled, true], [titled, false], [spans, true], [spans, false]]) {
+        const hit = candidates.find(([, title]) => exact ? title === name : title.includes(name));
+        if (hit) return hit[0];
+    }
+    return null;
+}"""
+
+# True when the open chat's header names this chat. Both sides are compared
+# lower-cased with whitespace collapsed; emoji render as <img> and drop out of
+# textContent, so unless `exact` is set either text may contain the other.
+JS_HEADER_MATCHES = """([name, exact]) => {
+    const norm = s => (s || '').replace(/\\s+/g, ' ').trim().toLowerCase();
+    const header = document.querySelector('#main header');
+    if (!header) return false;
+    return [...header.querySelectorAll('span[title], span[dir="auto"]')].some(el => {
+        const text = norm(el.getAttribute('title') || el.textContent);
+        return text && (text === name || (!exact && (text.includes(name) || name.includes(text))));
+    });
+}"""
+
+# Whether the header names the chat and the previous chat's row (if any) has
+# left the DOM
+JS_CHAT_STATE = f"""([name, oldRow]) => ({{
+    header: ({JS_HEADER_MATCHES})([name, false]),
+    detached: !(oldRow && oldRow.isConnected),
+}})"""
+
+# True once the chat is fully switched (see JS_CHAT_STATE)
+JS_CHAT_OPENED = f"""args => {{ const state = ({JS_CHAT_STATE})(args); return state.header && state.detached; }}"""
+
+# True once an element matching the selector has a title / text containing the name
+JS_HAS_TITLE_MATCH = """([sel, name]) => [...document.querySelectorAll(sel)].some(
+    el => (el.getAttribute('title') || el.textContent || '').toLowerCase().includes(name)
+)"""
+
+# Raw fields of every message row, read in a single round trip. Parsing
+# (regexes, strptime, hashing) happens in Python on the returned dicts.
+JS_EXTRACT_ALL = """([rowSel, textSels, metaSel]) => [...document.querySelectorAll(rowSel)].map(row => {
+    let textEl = null;
+    for (const sel of textSels) {
+        textEl = row.querySelector(sel);
+        if (textEl) break;
+    }
+    const pre = row.querySelector('div[data-pre-plain-text]');
+    const author = row.querySelector('span[data-testid="msg-author"]');
+    const labelled = row.querySelector('span[aria-label]');
+    const meta = row.querySelector(metaSel) || row.querySelector('span[dir="auto"]');
+    const timeEl = meta ? (meta.querySelector('span') || meta) : null;
+    return {
+        text: textEl ? textEl.innerText : null,
+        full_text: textEl ? null : row.innerText,
+        pre_plain: pre ? (pre.getAttribute('data-pre-plain-text') || '') : null,
+        author: author ? author.innerText : null,
+        aria_label: labelled ? labelled.getAttribute('aria-label') : null,
+        meta_time: timeEl ? timeEl.innerText : null,
+    };
+})"""
+
+# Row count and the oldest rendered row's data-pre-plain-text, for scrolling
+JS_SCROLL_STATE = """rowSel => {
+    const rows = document.querySelectorAll(rowSel);
+    const pre = rows.length ? rows[0].querySelector('div[data-pre-plain-text]') : null;
+    return {count: rows.length, oldest: pre ? (pre.getAttribute('data-pre-plain-text') || '') : null};
+}"""
+
+# True once the row count or the oldest rendered row differs from the baseline
+JS_ROWS_CHANGED = f"""([rowSel, count, oldest]) => {{
+    const state = ({JS_SCROLL_STATE})(rowSel);
+    return state.count !== count || state.oldest !== oldest;
+}}"""
+
 
 def _launch_persistent_context(playwright):
     """Launch a Chromium browser with a persistent user data directory.
@@ -56,6 +158,43 @@ def _launch_persistent_context(playwright):
 class WhatsAppService:
     """Handles WhatsApp Web QR code auth and DOM-based message scraping."""
 
+    def __init__(self):
+        # (time_fmt, date_fmt) that last parsed a data-pre-plain-text stamp
+        self._ts_fmt_cache: tuple[str, str] | None = None
+        # Browser kept open while used as a context manager (see __enter__)
+        self._playwright = None
+        self._context = None
+        self._page = None
+
+    def __enter__(self):
+        """Launch one browser for a run of scrape_group calls.
+
+        Chromium start-up and the IndexedDB session restore then happen once
+        per sync rather than once per group.
+        """
+        from playwright.sync_api import sync_playwright
+
+        if not self.has_session():
+            raise RuntimeError("No WhatsApp session found. Run setup first.")
+
+        self._playwright = sync_playwright().start()
+        try:
+            self._context = _launch_persistent_context(self._playwright)
+            self._page = self._context.pages[0] if self._context.pages else self._context.new_page()
+        except Exception:
+            self.__exit__(None, None, None)
+            raise
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        try:
+            if self._context is not None:
+                self._context.close()
+        finally:
+            if self._playwright is not None:
+                self._playwright.stop()
+            self._playwright = self._context = self._page = None
+
     def setup(self) -> bool:
         """Open WhatsApp Web in a visible browser for QR code scanning.
 
@@ -89,8 +228,9 @@ class WhatsAppService:
                 context.close()
 
     def has_session(self) -> bool:
-        """Check if a persistent browser profile directory exists with data."""
-        return WA_PROFILE_DIR.exists() and any(WA_PROFILE_DIR.iterdir())
+        """Check if the persistent browser profile holds WhatsApp Web data."""
+        # One stat instead of listing the (large) profile directory
+        return WA_SESSION_SENTINEL.is_dir()
 
     def scrape_group(self, group_name: str, since: datetime | None) -> list[dict]:
         """Open WhatsApp Web with saved session, navigate to a group, and scrape messages.
@@ -99,9 +239,15 @@ class WhatsAppService:
             group_name: The exact name of the WhatsApp group to scrape.
             since: Only return messages after this timestamp. If None, scrape all visible.
 
+        Inside a ``with WhatsAppService() as svc:`` block the already-open
+        browser is reused; otherwise a browser is launched for this call.
+
         Returns:
             List of normalized dicts ready for CommunicationItem storage.
         """
+        if self._page is not None:
+            return self._scrape_on_page(self._page, group_name, since)
+
         from playwright.sync_api import sync_playwright
 
         if not self.has_session():
@@ -112,34 +258,37 @@ class WhatsAppService:
             page = context.pages[0] if context.pages else context.new_page()
 
             try:
+                return self._scrape_on_page(page, group_name, since)
+            finally:
+                context.close()
+
+    def _scrape_on_page(self, page, group_name: str, since: datetime | None) -> list[dict]:
+        """Scrape one group on an open page, loading WhatsApp Web only if needed."""
+        try:
+            chat_list = f"{SEL_SIDE_PANEL}, {SEL_SIDE_PANEL_FALLBACK}"
+            if page.query_selector(chat_list) is None:
                 page.goto(WA_URL, wait_until="domcontentloaded")
 
                 # Wait for chat list to load (session restored)
-                page.wait_for_selector(
-                    f"{SEL_SIDE_PANEL}, {SEL_SIDE_PANEL_FALLBACK}",
-                    timeout=60_000,
-                )
-                logger.info("Chat list loaded, searching for group...")
+                page.wait_for_selector(chat_list, timeout=60_000)
+            logger.info("Chat list loaded, searching for group...")
 
-                # Search for the group
-                self._open_group(page, group_name)
+            # Search for the group
+            self._open_group(page, group_name)
 
-                # Scrape messages
-                messages = self._scrape_messages(page, group_name, since)
+            # Scrape messages
+            messages = self._scrape_messages(page, group_name, since)
 
-                return messages
+            return messages
 
-            except Exception as e:
-                logger.error(f"WhatsApp scrape failed for '{group_name}': {e}")
-                raise
-            finally:
-                context.close()
+        except Exception as e:
+            logger.error(f"WhatsApp scrape failed for '{group_name}': {e}")
+            raise
 
     def _open_group(self, page, group_name: str):
         """Search for and open a group chat by name."""
-        # Give WhatsApp Web a moment to finish rendering after chat list appears
+        # _find_search_input waits for the input itself, so no settle delay is needed
         page.wait_for_load_state("domcontentloaded")
-        page.wait_for_timeout(3000)
 
         search_input = self._find_search_input(page)
         if not search_input:
@@ -147,85 +296,74 @@ class WhatsAppService:
 
         logger.info(f"Found search input, typing '{group_name}'...")
         search_input.click()
-        page.wait_for_timeout(500)
+        try:
+            page.wait_for_function(JS_HAS_FOCUS, arg=search_input, timeout=2_000)
+        except Exception:
+            logger.debug("Search input did not report focus, typing anyway")
 
         # Use fill() for <input> elements, keyboard.type() for contenteditable divs
-        tag = search_input.evaluate("el => el.tagName")
-        if tag == "INPUT":
+        info = search_input.evaluate(JS_INPUT_INFO)
+        if info["tag"] in ("INPUT", "TEXTAREA"):
             search_input.fill(group_name)
         else:
+            if not info["editable"]:
+                logger.debug(f"Search target <{info['tag']}> is not editable, typing into focus")
             page.keyboard.type(group_name, delay=50)
 
-        # Wait for search results to populate
-        page.wait_for_timeout(2000)
-
-        # Log what we find for debugging
-        results = page.query_selector_all(SEL_SEARCH_RESULT_TITLE)
-        logger.info(f"Search results found: {len(results)} elements matching SEL_SEARCH_RESULT_TITLE")
-
-        if not results:
-            # Try broader selectors for search results
-            results = page.query_selector_all('span[title]')
-            logger.info(f"Fallback span[title] results: {len(results)}")
-            for r in results[:10]:
-                title = r.get_attribute("title") or ""
-                logger.debug(f"  Result title attr: '{title}'")
-
-        # Try to match by data-testid selector first
-        matched = False
-        results = page.query_selector_all(SEL_SEARCH_RESULT_TITLE)
-        for result in results:
-            title = (result.inner_text() or "").strip()
-            if title.lower() == group_name.lower():
-                result.click()
-                matched = True
-                logger.info(f"Exact match found: '{title}'")
-                break
-
-        if not matched:
-            for result in results:
-                title = (result.inner_text() or "").strip()
-                if group_name.lower() in title.lower():
-                    result.click()
-                    matched = True
-                    logger.info(f"Partial match found: '{title}'")
-                    break
-
-        # Fallback: try span[title] matching
-        if not matched:
-            spans = page.query_selector_all('span[title]')
-            for span in spans:
-                title = span.get_attribute("title") or ""
-                if title.lower() == group_name.lower():
-                    span.click()
-                    matched = True
-                    logger.info(f"Matched via span[title]: '{title}'")
-                    break
-
-        if not matched:
-            # Last resort: try partial match on span[title]
-            for span in spans:
-                title = span.get_attribute("title") or ""
-                if group_name.lower() in title.lower():
-                    span.click()
-                    matched = True
-                    logger.info(f"Partial matched via span[title]: '{title}'")
-                    break
+        # Wait for search results to populate. The unfiltered chat list already
+        # has result-shaped elements, so wait for one that names the group.
+        # Checking every animation frame reacts as soon as the list re-renders
+        # instead of at the next 100 ms poll.
+        try:
+            page.wait_for_function(
+                JS_HAS_TITLE_MATCH,
+                arg=[f"{SEL_SEARCH_RESULT_TITLE}, span[title]", group_name.lower()],
+                polling="raf",
+                timeout=5_000,
+            )
+        except Exception:
+            logger.debug(f"No search result naming '{group_name}' appeared within 5s")
 
-        if not matched:
+        # Match in the browser: exact then partial on the result titles, then
+        # exact then partial on any span[title]. Returns the element or null.
+        handle = page.evaluate_handle(JS_FIND_GROUP, [SEL_SEARCH_RESULT_TITLE, group_name.lower()])
+        match = handle.as_element()
+        if match is None:
             raise RuntimeError(f"Group '{group_name}' not found in WhatsApp search results")
 
-        # Wait for conversation panel to load
-        page.wait_for_selector(
-            f"{SEL_CONVERSATION_PANEL}, {SEL_CONVERSATION_PANEL_FALLBACK}, #main",
-            timeout=10_000,
-        )
-        page.wait_for_timeout(1500)
+        title = match.evaluate("el => (el.getAttribute('title') || el.innerText || '').trim()")
+        logger.info(f"Matched search result for '{group_name}': '{title}'")
+
+        # When the page is reused across groups the previous chat's panel and
+        # rows are still in the DOM, so waiting for them proves nothing. Wait
+        # for the header to name the matched chat and, if another chat was
+        # open, for its rows to be replaced.
+        name = " ".join(title.split()).lower()
+        already_open = page.evaluate(JS_HEADER_MATCHES, [name, True])
+        old_row = None if already_open else page.query_selector(f"#main {SEL_ROW}")
+        match.click()
+        try:
+            page.wait_for_function(JS_CHAT_OPENED, arg=[name, old_row], timeout=10_000)
+        except Exception:
+            state = page.evaluate(JS_CHAT_STATE, [name, old_row])
+            if not state["detached"]:
+                raise RuntimeError(f"Chat '{title}' did not replace the previously open chat")
+            # The previous chat is gone; the header just doesn't read like
+            # the search result (emoji, a fallback span[title] match, ...)
+            logger.warning(f"Chat header did not match '{title}' after opening; continuing")
+        self._wait_for_rows(page)
         logger.info(f"Opened group: {group_name}")
 
         # Clear the search to reset the side panel
         page.keyboard.press("Escape")
-        page.wait_for_timeout(500)
+
+    @staticmethod
+    def _wait_for_rows(page, timeout_ms: int = 10_000):
+        """Wait until the open chat has rendered at least one message row."""
+        try:
+            page.wait_for_selector(SEL_ROW, timeout=timeout_ms)
+        except Exception:
+            logger.warning(f"No message rows rendered within {timeout_ms} ms")
 
     def _find_search_input(self, page, timeout_ms: int = 15_000):
         """Locate the search input, retrying with multiple strategies."""
@@ -278,7 +416,6 @@ class WhatsAppService:
                 if box:
                     # Click near the top center of the side panel
                     page.mouse.click(box["x"] + box["width"] / 2, box["y"] + 30)
-                    page.wait_for_timeout(1000)
                     return page.wait_for_selector(all_selectors, timeout=5_000)
         except Exception:
             pass
@@ -288,20 +425,19 @@ class WhatsAppService:
     def _scrape_messages(self, page, group_name: str, since: datetime | None) -> list[dict]:
         """Extract messages from the currently open chat panel."""
         messages = []
-
-        # Wait for messages to render
-        page.wait_for_timeout(3000)
+        # Each group starts with a fresh format guess
+        self._ts_fmt_cache = None
 
         # Scroll up to load older messages if we have a since date
         if since:
             self._scroll_to_load(page, since)
 
-        msg_elements = page.query_selector_all('div[role="row"]')
-        logger.info(f"Found {len(msg_elements)} div[role='row'] elements in '{group_name}'")
+        rows = page.evaluate(JS_EXTRACT_ALL, [SEL_ROW, SEL_MSG_TEXT_CANDIDATES, SEL_MSG_META])
+        logger.info(f"Found {len(rows)} div[role='row'] elements in '{group_name}'")
 
-        for el in msg_elements:
+        for row in rows:
             try:
-                msg = self._parse_message_element(el, group_name)
+                msg = self._parse_row_dict(row, group_name)
                 if msg is None:
                     continue
 
@@ -317,30 +453,18 @@ class WhatsAppService:
         logger.info(f"Parsed {len(messages)} messages from '{group_name}'")
         return messages
 
-    def _parse_message_element(self, el, group_name: str) -> dict | None:
-        """Parse a single message element into a normalized dict."""
-        # Extract message text — try multiple selectors
-        text_el = None
-        for sel in [
-            SEL_MSG_TEXT,                    # data-testid="msg-text"
-            'span.selectable-text',          # class-based
-            'span[dir="ltr"]',               # text direction attribute
-            'div.copyable-text span',        # copyable text container
-        ]:
-            text_el = el.query_selector(sel)
-            if text_el:
-                break
-
-        if not text_el:
+    def _parse_row_dict(self, row: dict, group_name: str) -> dict | None:
+        """Parse the raw fields of one message row (from JS_EXTRACT_ALL) into a normalized dict."""
+        if row["text"] is None:
             # Last resort: get all text from the element, skip if too short
-            full_text = el.inner_text().strip()
+            full_text = (row["full_text"] or "").strip()
             if len(full_text) > 5:
                 # Use the full element text but try to clean it
                 body = full_text
             else:
                 return None
         else:
-            body = text_el.inner_text().strip()
+            body = row["text"].strip()
 
         if not body:
             return None
@@ -349,48 +473,34 @@ class WhatsAppService:
         sender = "Unknown"
 
         # Try data-pre-plain-text attribute first (most reliable)
-        pre_plain_el = el.query_selector('div[data-pre-plain-text]')
-        if pre_plain_el:
-            pre_text = pre_plain_el.get_attribute("data-pre-plain-text") or ""
-            match = re.search(r'\]\s*(.+?):\s*$', pre_text)
+        pre_text = row["pre_plain"]
+        if pre_text is not None:
+            match = _SENDER_RE.search(pre_text)
             if match:
                 sender = match.group(1).strip()
 
         # Fallback: try data-testid for sender
-        if sender == "Unknown":
-            sender_el = el.query_selector('span[data-testid="msg-author"]')
-            if sender_el:
-                sender = sender_el.inner_text().strip()
+        if sender == "Unknown" and row["author"] is not None:
+            sender = row["author"].strip()
 
         # Fallback: try aria-label or any span that looks like a contact name
         if sender == "Unknown":
-            sender_el = el.query_selector('span[aria-label]')
-            if sender_el:
-                label = sender_el.get_attribute("aria-label") or ""
-                if label and ":" not in label and len(label) < 100:
-                    sender = label
+            label = row["aria_label"] or ""
+            if label and ":" not in label and len(label) < 100:
+                sender = label
 
         # Extract timestamp
-        timestamp = datetime.now()
+        parsed_ts: datetime | None = None
 
         # Try data-pre-plain-text for full date+time (most accurate)
-        if pre_plain_el:
-            pre_text = pre_plain_el.get_attribute("data-pre-plain-text") or ""
+        if pre_text is not None:
             parsed_ts = self._parse_pre_plain_text_timestamp(pre_text)
-            if parsed_ts:
-                timestamp = parsed_ts
 
         # Fallback: try msg-meta time display
-        if not pre_plain_el or timestamp == datetime.now():
-            meta_el = el.query_selector(SEL_MSG_META)
-            if not meta_el:
-                # Try any small span that looks like a time
-                meta_el = el.query_selector('span[dir="auto"]')
-            if meta_el:
-                time_el = meta_el.query_selector("span") or meta_el
-                if time_el:
-                    time_text = time_el.inner_text().strip()
-                    timestamp = self._parse_wa_time(time_text)
+        if parsed_ts is None and row["meta_time"] is not None:
+            parsed_ts = self._parse_wa_time(row["meta_time"].strip())
+
+        timestamp = parsed_ts or datetime.now()
 
         source_id = self.generate_source_id(timestamp, sender, body)
 
@@ -411,10 +521,9 @@ class WhatsAppService:
         of the DOM container structure.
         """
         # Click on a message row to ensure the conversation area has focus
-        first_row = page.query_selector('div[role="row"]')
+        first_row = page.query_selector(SEL_ROW)
         if first_row:
             first_row.click()
-            page.wait_for_timeout(500)
         else:
             logger.warning("No message rows found to focus for scrolling")
             return
@@ -422,29 +531,36 @@ class WhatsAppService:
         max_scrolls = 80
         prev_count = 0
         for i in range(max_scrolls):
+            # Row count and oldest visible message in one round trip
+            state = page.evaluate(JS_SCROLL_STATE, SEL_ROW)
+            current_count = state["count"]
+
             # Check the oldest visible message's timestamp
-            rows = page.query_selector_all('div[role="row"]')
-            if rows:
-                pre_plain = rows[0].query_selector('div[data-pre-plain-text]')
-                if pre_plain:
-                    pre_text = pre_plain.get_attribute("data-pre-plain-text") or ""
-                    ts = self._parse_pre_plain_text_timestamp(pre_text)
-                    if ts and ts <= since:
-                        logger.info(f"Scrolled back to {ts}, reached target {since}")
-                        break
+            if state["oldest"] is not None:
+                ts = self._parse_pre_plain_text_timestamp(state["oldest"])
+                if ts and ts <= since:
+                    logger.info(f"Scrolled back to {ts}, reached target {since}")
+                    break
 
             # Check if we've stopped loading new messages (hit the top)
-            current_count = len(rows)
             if i > 3 and current_count == prev_count:
                 logger.info(f"No new messages loaded after scroll {i}, stopping")
                 break
             prev_count = current_count
 
-            # Scroll up using keyboard — works without knowing the container
+            # Scroll up using keyboard — works without knowing the container,
+            # then wait until the rendered rows change (older messages loaded
+            # or the list scrolled) rather than for a fixed delay
             page.keyboard.press("PageUp")
-            page.wait_for_timeout(1500)
+            if current_count:
+                try:
+                    page.wait_for_function(
+                        JS_ROWS_CHANGED, arg=[SEL_ROW, current_count, state["oldest"]], timeout=3_000
+                    )
+                except Exception:
+                    logger.debug(f"Rows unchanged after scroll {i}")
 
-        total = len(page.query_selector_all('div[role="row"]'))
+        total = page.evaluate(JS_SCROLL_STATE, SEL_ROW)["count"]
         logger.info(f"After scrolling: {total} message rows loaded")
 
     @staticmethod
@@ -459,27 +575,42 @@ class WhatsAppService:
                 continue
         return today
 
-    @staticmethod
-    def _parse_pre_plain_text_timestamp(pre_text: str) -> datetime | None:
+    def _parse_pre_plain_text_timestamp(self, pre_text: str) -> datetime | None:
         """Parse timestamp from data-pre-plain-text attribute.
 
         Format examples:
             [10:30 AM, 1/15/2025] Sender:
             [10:30, 15/01/2025] Sender:
+
+        The format pair that last matched is tried first, since a chat's
+        locale does not change between messages. The result always equals a
+        full scan: a day-first hit with day <= 12 would also parse month-first,
+        so it falls through to the scan, which reads it month-first. Source
+        ids built from the timestamp therefore never depend on message order.
         """
-        match = re.search(r'\[(.+?),\s*(.+?)\]', pre_text)
+        match = _PRE_PLAIN_RE.search(pre_text)
         if not match:
             return None
 
-        time_part = match.group(1).strip()
-        date_part = match.group(2).strip()
+        stamp = f"{match.group(1).strip()} {match.group(2).strip()}"
+
+        if self._ts_fmt_cache:
+            time_fmt, date_fmt = self._ts_fmt_cache
+            try:
+                parsed = datetime.strptime(stamp, f"{time_fmt} {date_fmt}")
+            except ValueError:
+                parsed = None
+            if parsed and not (date_fmt == "%d/%m/%Y" and parsed.day <= 12):
+                return parsed
 
         for time_fmt in ("%I:%M %p", "%H:%M"):
             for date_fmt in ("%m/%d/%Y", "%d/%m/%Y", "%Y-%m-%d"):
                 try:
-                    return datetime.strptime(f"{time_part} {date_part}", f"{time_fmt} {date_fmt}")
+                    parsed = datetime.strptime(stamp, f"{time_fmt} {date_fmt}")
                 except ValueError:
                     continue
+                self._ts_fmt_cache = (time_fmt, date_fmt)
+                return parsed
 
         return None
 
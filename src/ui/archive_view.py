@@ -85,16 +85,17 @@ class ArchiveView(QWidget):
         try:
             from src.services.checklist_service import ChecklistService
             checklist_svc = ChecklistService()
+            with checklist_svc.scope() as session:
+                key_dates_items = checklist_svc.get_checked_items("key_dates", session)
+                action_items = checklist_svc.get_checked_items("action_items", session)
 
             # Key dates: sort chronologically
-            key_dates_items = checklist_svc.get_checked_items("key_dates")
             key_dates_items = sort_items_by_date(key_dates_items)
             self._key_dates_card.set_checklist_items(
                 [(item.id, item.item_text, item.is_checked) for item in key_dates_items]
             )
 
             # Action items: sort alphabetically
-            action_items = checklist_svc.get_checked_items("action_items")
             action_items = sort_items_alphabetically(action_items)
             self._action_items_card.set_checklist_items(
                 [(item.id, item.item_text, item.is_checked) for item in action_items]
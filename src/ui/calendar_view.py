@@ -590,9 +590,14 @@ class CalendarView(QWidget):
         try:
             from src.services.checklist_service import ChecklistService
             svc = ChecklistService()
+            today = date.today()
+            with svc.scope() as session:
+                month_items = svc.get_items_for_month(self._current_year, self._current_month, session)
+                # Next 7 days
+                upcoming_items = svc.get_items_for_range(today, today + timedelta(days=6), session)
+                undated = svc.get_undated_items("key_dates", session)
 
-            # Get items for current month
-            month_items = svc.get_items_for_month(self._current_year, self._current_month)
+            # Group month items by date
             items_by_date: dict[date, list] = defaultdict(list)
             for item in month_items:
                 if item.event_date:
@@ -615,12 +620,9 @@ class CalendarView(QWidget):
                 self._detail.setVisible(False)
 
             # Update upcoming list (next 7 days)
-            today = date.today()
-            upcoming_items = svc.get_items_for_range(today, today + timedelta(days=6))
             self._upcoming.set_items(upcoming_items)
 
             # Update undated items banner
-            undated = svc.get_undated_items("key_dates")
             self._undated_banner.set_count(len(undated))
 
         except Exception:
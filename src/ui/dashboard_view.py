@@ -128,10 +128,11 @@ class DashboardView(QWidget):
             from src.services.summary_service import SummaryService
             from src.utils.date_parser import sort_strings_by_date
             svc = SummaryService()
-            agg = svc.get_aggregated_summary()
+            summaries = svc.get_rolling_summaries()
+            agg = svc.get_aggregated_summary(summaries=summaries)
 
             # Overview: show structured summaries per child/general
-            overview = svc.get_rolling_raw_summaries()
+            overview = svc.get_rolling_raw_summaries(summaries=summaries)
             self._nia_card.set_items(overview.get("nia_whyte_lovable_lambs", []))
             self._zoe_card.set_items(overview.get("zoe_whyte_hedgehogs", []))
             self._general_card.set_items(overview.get("general_bisc", []))
@@ -151,16 +152,17 @@ class DashboardView(QWidget):
             from src.services.checklist_service import ChecklistService
             from src.utils.date_parser import sort_items_by_date, sort_items_alphabetically
             checklist_svc = ChecklistService()
+            with checklist_svc.scope() as session:
+                key_dates_items = checklist_svc.get_unchecked_items("key_dates", session)
+                action_items = checklist_svc.get_unchecked_items("action_items", session)
 
             # Key dates: sort chronologically
-            key_dates_items = checklist_svc.get_unchecked_items("key_dates")
             key_dates_items = sort_items_by_date(key_dates_items)
             self._key_dates_card.set_checklist_items(
                 [(item.id, item.item_text, item.is_checked) for item in key_dates_items]
             )
 
             # Action items: sort alphabetically
-            action_items = checklist_svc.get_unchecked_items("action_items")
             action_items = sort_items_alphabetically(action_items)
             self._action_items_card.set_checklist_items(
                 [(item.id, item.item_text, item.is_checked) for item in action_items]
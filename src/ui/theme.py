@@ -1,5 +1,7 @@
 """macOS-inspired light theme with Apple design language."""
 
+from functools import cache
+
 # =============================================================================
 # COLOR PALETTE - Apple macOS inspired
 # =============================================================================
@@ -87,7 +89,9 @@ RADIUS = {
 # =============================================================================
 # HELPER FUNCTIONS
 # =============================================================================
+# The palette is static, so every generated stylesheet is memoized.
 
+@cache
 def get_card_style(selected: bool = False) -> str:
     """Return QSS for communication card widgets with optional selection state."""
     c = COLORS
@@ -105,6 +109,7 @@ def get_card_style(selected: bool = False) -> str:
         """
 
 
+@cache
 def get_checkbox_label_style(checked: bool = False) -> str:
     """Return QSS for checkbox label with strikethrough when checked."""
     c = COLORS
@@ -114,6 +119,7 @@ def get_checkbox_label_style(checked: bool = False) -> str:
         return f"color: {c['text_primary']}; text-decoration: none;"
 
 
+@cache
 def get_webview_css() -> str:
     """Return CSS for QWebEngineView HTML content."""
     c = COLORS
@@ -201,6 +207,7 @@ def source_badge_html(source: str) -> str:
     )
 
 
+@cache
 def get_landing_button_style() -> str:
     """Return stylesheet for landing page navigation buttons."""
     c = COLORS
@@ -230,6 +237,7 @@ def get_landing_button_style() -> str:
 # MAIN APPLICATION STYLESHEET
 # =============================================================================
 
+@cache
 def get_app_stylesheet() -> str:
     """Comprehensive QSS stylesheet for the entire application (macOS-inspired)."""
     c = COLORS
@@ -12,6 +12,7 @@ from PySide6.QtWidgets import (
     QVBoxLayout,
     QWidget,
 )
+from sqlalchemy import func, select
 
 from src.models.base import get_session
 from src.models.communication import CommunicationItem
@@ -70,11 +71,13 @@ class DaySection(QFrame):
         try:
             day_start = datetime.combine(self._date, datetime.min.time())
             day_end = datetime.combine(self._date, datetime.max.time())
-            return (
-                session.query(CommunicationItem)
-                .filter(CommunicationItem.timestamp >= day_start)
-                .filter(CommunicationItem.timestamp <= day_end)
-                .count()
+            # Plain COUNT(*) on the timestamp index; Query.count() would wrap
+            # a full-column subquery
+            return session.scalar(
+                select(func.count())
+                .select_from(CommunicationItem)
+                .where(CommunicationItem.timestamp >= day_start)
+                .where(CommunicationItem.timestamp <= day_end)
             )
         finally:
             session.close()
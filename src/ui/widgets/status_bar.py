@@ -2,6 +2,7 @@
 
 from PySide6.QtCore import Qt, Slot
 from PySide6.QtWidgets import QLabel, QProgressBar, QStatusBar
+from sqlalchemy import func, select
 
 from src.models.base import get_session
 from src.models.communication import CommunicationItem
@@ -40,8 +41,16 @@ class SyncStatusBar(QStatusBar):
     def update_counts(self):
         session = get_session()
         try:
-            gmail_count = session.query(CommunicationItem).filter_by(source="gmail").count()
-            bw_count = session.query(CommunicationItem).filter_by(source="brightwheel").count()
+            # One grouped count over the source index instead of a query per source
+            counts = dict(
+                session.execute(
+                    select(CommunicationItem.source, func.count())
+                    .where(CommunicationItem.source.in_(("gmail", "brightwheel")))
+                    .group_by(CommunicationItem.source)
+                ).all()
+            )
+            gmail_count = counts.get("gmail", 0)
+            bw_count = counts.get("brightwheel", 0)
             total = gmail_count + bw_count
             self._count_label.setText(
                 f"Items: {total} (Gmail: {gmail_count}, BW: {bw_count})"
@@ -30,6 +30,17 @@ NUMERIC_WITH_YEAR_PATTERN = re.compile(r'\b(\d{1,2})/(\d{1,2})/(\d{4})\b')
 # Numeric without year: "2/14" or "02/14"
 NUMERIC_SHORT_PATTERN = re.compile(r'\b(\d{1,2})/(\d{1,2})\b')
 
+# Cheap "could this mention a date at all?" check, used to skip Claude for
+# plainly dateless text: weekdays, months, relative days, numeric dates, ordinals
+DATEISH_PATTERN = re.compile(
+    r'\b(?:(?:mon|tues?|wed(?:nes)?|thu(?:rs?)?|fri|sat(?:ur)?|sun)(?:days?)?'
+    r'|jan(?:uary)?|feb(?:ruary)?|mar(?:ch)?|apr(?:il)?|may|june?|july?|aug(?:ust)?'
+    r'|sept?(?:ember)?|oct(?:ober)?|nov(?:ember)?|dec(?:ember)?)\b'
+    r'|\d{1,2}[-/]\d{1,2}|\b\d{1,2}(?:st|nd|rd|th)\b'
+    r'|\b(?:today|tonight|tomorrow|weekend|next\s+(?:week|month)|on\s+\d)',
+    re.IGNORECASE
+)
+
 
 def _infer_year(month: int, day: int, reference_year: int | None) -> date | None:
     """Build a date, inferring year if needed. Returns None on invalid dates."""
@@ -45,6 +56,11 @@ def _infer_year(month: int, day: int, reference_year: int | None) -> date | None
         return None
 
 
+def may_contain_date(text: str) -> bool:
+    """Return True if text has any date-like token worth a slower lookup."""
+    return DATEISH_PATTERN.search(text) is not None
+
+
 def extract_date_from_text(text: str, reference_year: int | None = None) -> date | None:
     """Extract the first date mention from item text.
 
@@ -1,6 +1,7 @@
 """Date utility functions."""
 
 from datetime import date, datetime, timedelta
+from functools import lru_cache
 
 from src.config.settings import SUMMARY_ROLLING_DAYS
 
@@ -23,6 +24,7 @@ def date_label(d: date) -> str:
         return d.strftime("%b %d")
 
 
+@lru_cache(maxsize=2048)
 def parse_timestamp(ts: str | int | float | datetime) -> datetime:
     """Normalize various timestamp formats to datetime."""
     if isinstance(ts, datetime):
@@ -0,0 +1,18 @@
+"""PDF utility functions."""
+
+
+def extract_pdf_text(path: str) -> str:
+    """Extract the text of every page of a PDF, joined by blank lines.
+
+    Kept in this light module so it can run in a worker process without
+    importing the service layer.
+    """
+    import pdfplumber
+
+    extracted_pages = []
+    with pdfplumber.open(path) as pdf:
+        for page in pdf.pages:
+            page_text = page.extract_text()
+            if page_text:
+                extracted_pages.append(page_text)
+    return "\n\n".join(extracted_pages)